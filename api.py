@@ -0,0 +1,102 @@
+import json
+from datetime import datetime
+from flask import Blueprint, current_app, request, jsonify, abort
+import queries
+from forms import STATE_CHOICES, GENRE_CHOICES
+from routing import use_replica
+
+# region JSON API v1
+# Read endpoints serve the same data as the html pages. Responses carry a
+# strong ETag of their body so clients revalidate with If-None-Match and get
+# 304 Not Modified with no body when nothing changed. The ETag is only known
+# once the body is built, so a 304 saves the transfer, not the queries. All
+# endpoints are read only and may be served from a replica.
+
+api = Blueprint('api', __name__)
+api.before_request(use_replica)
+
+
+def json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(repr(value))
+
+
+def json_response(payload, max_age=None):
+    """ The function make a cacheable json response, answering 304 when the
+        request If-None-Match holds the response ETag. The ETag is the hash of
+        the body, so the payload is still queried and serialized for a 304,
+        which only saves the bandwidth of the body.
+
+    Args:
+       payload: response data (dict)
+       max_age: seconds clients may reuse the response, API_CACHE_MAX_AGE by default (int)
+
+    Returns:
+       Json response or 304 response
+    """
+    response = current_app.response_class(
+        json.dumps(payload, default=json_default, sort_keys=True) + '\n', mimetype='application/json')
+    response.add_etag()
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age or current_app.config['API_CACHE_MAX_AGE']
+    return response.make_conditional(request)
+
+
+@api.route('/venues')
+def venues():
+    areas, prev_cursor, next_cursor = queries.venue_areas(request.args.get('genre'))
+    return json_response({"areas": areas, "prev_cursor": prev_cursor, "next_cursor": next_cursor})
+
+
+@api.route('/venues/<int:venue_id>')
+def venue(venue_id):
+    venue = queries.venue_detail(venue_id, archived=request.args.get('past') == 'all')
+    if venue is None:
+        abort(404)
+    return json_response(venue)
+
+
+@api.route('/venues/search')
+def search_venues():
+    return json_response(queries.venue_search(request.args.get('search_term', '')))
+
+
+@api.route('/artists')
+def artists():
+    artists, prev_cursor, next_cursor = queries.artist_list(request.args.get('genre'))
+    return json_response({"artists": artists, "prev_cursor": prev_cursor, "next_cursor": next_cursor})
+
+
+@api.route('/artists/<int:artist_id>')
+def artist(artist_id):
+    artist = queries.artist_detail(artist_id, archived=request.args.get('past') == 'all')
+    if artist is None:
+        abort(404)
+    return json_response(artist)
+
+
+@api.route('/artists/search')
+def search_artists():
+    return json_response(queries.artist_search(request.args.get('search_term', '')))
+
+
+@api.route('/shows')
+def shows():
+    shows, prev_cursor, next_cursor = queries.show_list()
+    return json_response({"shows": shows, "prev_cursor": prev_cursor, "next_cursor": next_cursor})
+
+
+@api.route('/choices')
+def choices():
+    return json_response({"states": [value for value, label in STATE_CHOICES],
+                          "genres": [value for value, label in GENRE_CHOICES]},
+                         current_app.config['CHOICES_CACHE_MAX_AGE'])
+
+
+@api.errorhandler(400)
+@api.errorhandler(404)
+def error(error):
+    return jsonify({"error": error.code, "message": error.description}), error.code
+
+# endregion
@@ -0,0 +1,40 @@
+from models import db, Show, ShowArchive
+from cache import page_cache
+
+# region Show archive
+# Past shows are moved from Shows to ShowsArchive in batches, each batch is
+# copied and deleted in one transaction so an interrupted run can be started
+# again. Only shows already rolled over to the past counters are archived,
+# the counters keep counting them.
+
+ARCHIVE_COLUMNS = ['id', 'venue_id', 'artist_id', 'start_time', 'end_time']
+
+
+def archive_shows(before, batch_size=1000):
+    """ The function move past shows that started before the given time to
+        the archive, committing every batch.
+
+    Args:
+       before: shows starting before this time are archived (datetime)
+       batch_size: number of shows moved per transaction (int)
+
+    Returns:
+       Number of shows archived (int)
+    """
+    archived = 0
+    while True:
+        ids = [id for id, in db.session.query(Show.id).filter(
+            Show.is_past == True, Show.start_time < before).order_by(Show.id).limit(batch_size)]
+        if not ids:
+            return archived
+        venue_ids = [id for id, in db.session.query(Show.venue_id).filter(Show.id.in_(ids)).distinct()]
+        artist_ids = [id for id, in db.session.query(Show.artist_id).filter(Show.id.in_(ids)).distinct()]
+        db.session.execute(ShowArchive.__table__.insert().from_select(
+            ARCHIVE_COLUMNS, db.select(*[Show.__table__.c[column] for column in ARCHIVE_COLUMNS]).where(Show.id.in_(ids))))
+        Show.query.filter(Show.id.in_(ids)).delete(synchronize_session=False)
+        db.session.commit()
+        page_cache.invalidate('venue', *venue_ids)
+        page_cache.invalidate('artist', *artist_ids)
+        archived += len(ids)
+
+# endregion
@@ -0,0 +1,188 @@
+from flask import Blueprint, render_template, request, flash, redirect, url_for, abort, jsonify
+from forms import ArtistForm, ValidPhoneNumber
+from models import db, Artist, Genre
+import queries
+from cache import page_cache
+from routing import read_replica
+from deletion import delete_artists
+from jobs import jobs
+
+# region Artist views
+
+artist_pages = Blueprint('artists', __name__)
+
+
+@artist_pages.route('/artists')
+@read_replica
+def artists():
+    """ The function show one page of artists in database ordered by name,
+        filtered by the genre given in the url if any.
+
+    Returns:
+       Render artists page with artist name   
+    """
+    artists, prev_cursor, next_cursor = queries.artist_list(request.args.get('genre'))
+    return render_template('pages/artists.html', artists=artists, prev_cursor=prev_cursor, next_cursor=next_cursor)
+
+
+@artist_pages.route('/artists/search', methods=['POST'])
+@read_replica
+def search_artists():
+    """ The function search on artists by name with ranked full text and partial string search  
+
+    Returns:
+       Render search artists page with results of artists count and artists name   
+    """
+    Response = queries.artist_search(request.form.get('search_term'))
+    return render_template('pages/search_artists.html', results=Response, search_term=request.form.get('search_term', ''))
+
+
+@artist_pages.route('/artists/<int:artist_id>')
+@read_replica
+@page_cache.cached('artist', 'artist_id')
+def show_artist(artist_id):
+    """ The function shows the artist page with the given artist_id  
+    
+    Args:
+    artist_id: artist id is primary key and use to query any Artist by its id 
+
+    Returns:
+       Render artists page for certain id with results of artist properties   
+    """
+    artist = queries.artist_detail(artist_id, archived=request.args.get('past') == 'all')
+    if artist is None:
+        abort(404)
+    return render_template('pages/show_artist.html', artist=artist)
+
+
+@artist_pages.route('/artists/<int:artist_id>', methods=['DELETE'])
+def delete_artist(artist_id):
+    """ The function delete the artist with its id and its shows from database
+
+    Args:
+    artist_id: artist id is primary key and use to query any Artist by its id
+
+    Returns:
+       Json of deleted artist and shows count, ERROR 404 when not found and 400 for faild
+    """
+    try:
+        Deleted = delete_artists(Artist.id == artist_id)
+    except:
+        db.session.rollback()
+        abort(400)
+    finally:
+        db.session.close()
+    if Deleted["deleted"] == 0:
+        abort(404)
+    return jsonify(Deleted)
+
+#  Update
+#  ----------------------------------------------------------------
+
+
+@artist_pages.route('/artists/<int:artist_id>/edit', methods=['GET'])
+def edit_artist(artist_id):
+    """ The function request artist properties by its id from database
+        and populate properties to Artist Form.   
+
+    Args: 
+       artist_id: artist id is primary key and use to query any Artist by its id 
+
+    Returns:
+       Render Edit page for artist.     
+    """
+    Update_Artist= Artist.query.options(db.joinedload(Artist.genres)).get(artist_id)
+    artist = {
+        "id": Update_Artist.id,
+        "name": Update_Artist.name,
+        "genres": [genre.name for genre in Update_Artist.genres],
+        "city": Update_Artist.city,
+        "state": Update_Artist.state,
+        "phone": Update_Artist.phone,
+        "website": Update_Artist.website,
+        "facebook_link": Update_Artist.facebook_link,
+        "seeking_venue": Update_Artist.seeking_venue,
+        "seeking_description": Update_Artist.seeking_description,
+        "image_link": Update_Artist.image_link
+    }
+    form = ArtistForm(data=artist)
+    return render_template('forms/edit_artist.html', form=form, artist=artist)
+
+
+@artist_pages.route('/artists/<int:artist_id>/edit', methods=['POST'])
+def edit_artist_submission(artist_id):
+    """ The function update artist properties by its id to database   
+
+    Args: 
+       artist_id: artist id is primary key and use to query any Artist by its id 
+
+    Returns:
+       Render artist page for updated artist.     
+    """
+    try:
+        Artist_form = ArtistForm(request.form)
+        Update_Artist= Artist.query.get(artist_id)
+        Update_Artist.name= Artist_form.name.data
+        Update_Artist.genres= Genre.get_or_create_all(Artist_form.genres.data)
+        Update_Artist.city= Artist_form.city.data
+        Update_Artist.state= Artist_form.state.data
+        Update_Artist.phone= Artist_form.phone.data
+        Update_Artist.facebook_link= Artist_form.facebook_link.data
+        if(not ValidPhoneNumber(Artist_form.phone.data)):
+            raise ValueError
+        db.session.commit()
+        page_cache.invalidate('artist', artist_id)
+        jobs.enqueue('invalidate_related_pages', 'artist', artist_id)
+    except ValueError:
+        db.session.rollback()
+        flash('Incorrect phone number format xxx-xxx-xxxx   (' + request.form['phone']+ '),  please try again.')
+    except:
+        db.session.rollback()
+    finally:
+        db.session.close()
+    return redirect(url_for('artists.show_artist', artist_id=artist_id))
+
+
+#  Create Artist
+#  ----------------------------------------------------------------
+
+
+@artist_pages.route('/artists/create', methods=['GET'])
+def create_artist_form():
+    form = ArtistForm()
+    return render_template('forms/new_artist.html', form=form)
+
+
+@artist_pages.route('/artists/create', methods=['POST'])
+def create_artist_submission():
+    """ The function create new artist with properties filled into Artist Form
+        and insert new artist to database   
+
+    Returns:
+       Render Home Page with flash for successed or faild   
+    """
+    New_Artist_Form = ArtistForm(request.form)
+    try:
+        New_Artist = Artist()
+        New_Artist.name = New_Artist_Form.name.data
+        New_Artist.genres = Genre.get_or_create_all(New_Artist_Form.genres.data)
+        New_Artist.city = New_Artist_Form.city.data
+        New_Artist.state = New_Artist_Form.state.data
+        New_Artist.phone = New_Artist_Form.phone.data
+        New_Artist.facebook_link = New_Artist_Form.facebook_link.data
+        if(not ValidPhoneNumber(New_Artist_Form.phone.data)):
+            raise ValueError
+        db.session.add(New_Artist)
+        db.session.commit()
+        flash('Artist ' + request.form['name'] + ' was successfully listed!')
+    except ValueError:
+        db.session.rollback()
+        flash('Incorrect phone number format xxx-xxx-xxxx   (' + request.form['phone']+ '),  please try again.')
+    except:
+        db.session.rollback()
+        flash('An error occurred. Artist ' + request.form['name'] + ' could not be listed.')
+    finally:
+        db.session.close()
+    return render_template('pages/home.html')
+
+# endregion
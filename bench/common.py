@@ -0,0 +1,49 @@
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+# The scripts run as python bench/<script>.py from the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault('SECRET_KEY', 'bench-secret-key')
+
+
+def bench_app(**settings):
+    """ The function build the app with the config module settings, the
+        database of SQLALCHEMY_DATABASE_URI in the environment (a SQLite file
+        in a temporary directory by default) and no page cache or job threads.
+
+    Args:
+       settings: config values overriding the config module
+
+    Returns:
+       Flask app
+    """
+    import config
+    from app import create_app
+    directory = tempfile.mkdtemp(prefix='fyyur-bench-')
+    options = {key: getattr(config, key) for key in dir(config) if key.isupper()}
+    options.update(
+        SQLALCHEMY_DATABASE_URI=os.environ.get(
+            'SQLALCHEMY_DATABASE_URI', 'sqlite:///{}'.format(os.path.join(directory, 'fyyur.db'))),
+        SQLALCHEMY_REPLICA_URIS=[], JOBS_DATABASE=os.path.join(directory, 'jobs.sqlite'), JOBS_WORKERS=0,
+        IMAGE_CACHE_DIR=os.path.join(directory, 'image_cache'), LOG_FILE=os.path.join(directory, 'fyyur.log'),
+        CACHE_TYPE='null', DEBUG=False)
+    options.update(settings)
+    return create_app(SimpleNamespace(**options))
+
+
+
+def percentile(samples, percent):
+    """ The function return the nearest rank percentile of the samples.
+
+    Args:
+       samples: measured values (list)
+       percent: percentile between 0 and 100 (float)
+
+    Returns:
+       Value of the percentile
+    """
+    samples = sorted(samples)
+    return samples[max(0, min(len(samples) - 1, int(round(percent / 100 * len(samples))) - 1))]
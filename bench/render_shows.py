@@ -0,0 +1,62 @@
+""" Time the rendering of the shows page with many show tiles, before and
+    after the show times are formatted from datetimes by the cached filter.
+
+    python bench/render_shows.py [--rows 10000] [--repeat 5]
+"""
+import argparse
+import timeit
+from datetime import datetime, timedelta
+from common import bench_app
+
+
+def string_datetime(value, format='medium'):
+    # The filter before the cached patterns, formatting show times the query
+    # helpers passed as strings
+    import babel.dates
+    import dateutil.parser
+    date = dateutil.parser.parse(value)
+    if format == 'full':
+        format = "EEEE MMMM, d, y 'at' h:mma"
+    elif format == 'medium':
+        format = "EE MM, dd, y h:mma"
+    return babel.dates.format_datetime(date, format, locale='en')
+
+
+def make_shows(rows):
+    # Shows every 3 hours over a few months, so start times repeat across
+    # venues the way they do on the site
+    start = datetime(2026, 1, 1, 20, 0)
+    return [{"venue_id": number % 50 + 1, "venue_name": 'Venue {}'.format(number % 50),
+             "artist_id": number % 200 + 1, "artist_name": 'Artist {}'.format(number % 200),
+             "artist_image_link": 'https://example.com/artists/{}.jpg'.format(number % 200),
+             "start_time": start + timedelta(hours=3 * (number % 1000))} for number in range(rows)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000, help='show tiles on the page')
+    parser.add_argument('--repeat', type=int, default=5, help='timed renders of each variant')
+    options = parser.parse_args()
+
+    from flask import render_template
+    from app import format_datetime
+    app = bench_app()
+    shows = make_shows(options.rows)
+    string_shows = [dict(show, start_time=show["start_time"].strftime('%Y-%m-%d %H:%M:%S')) for show in shows]
+    variants = [
+        ('before: string times, dateutil + babel per tile', string_datetime, string_shows),
+        ('after: datetimes, cached patterns and results', format_datetime, shows),
+    ]
+    with app.test_request_context('/shows'):
+        for name, datetime_filter, rows in variants:
+            app.jinja_env.filters['datetime'] = datetime_filter
+            format_datetime.cache_clear()
+            render = lambda: render_template('pages/shows.html', shows=rows, prev_cursor=None, next_cursor=None)
+            # The first render compiles the template and fills the filter cache
+            render()
+            seconds = min(timeit.repeat(render, number=1, repeat=options.repeat))
+            print('{:<50} {:8.1f} ms'.format(name, seconds * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+""" Seed the database of SQLALCHEMY_DATABASE_URI with about a million shows
+    and time the show queries of the venue and artist pages.
+
+    SQLALCHEMY_DATABASE_URI=postgresql://postgres@localhost:5432/fyyur_bench \
+        python bench/show_queries.py [--shows 1000000] [--samples 200]
+
+    The Shows table is only seeded when it is empty, so later runs time the
+    same data. A temporary SQLite file is used when the variable is not set.
+"""
+import random
+import argparse
+import time
+from datetime import datetime, timedelta
+from common import bench_app, percentile
+
+
+def seed(shows, venues, artists, batch_size=10000):
+    # Show n is the (n // venues)th show of its venue, 3 hours after the
+    # previous one, so the shows of a venue never overlap. Half of them are past.
+    from models import db, Venue, Artist, Show
+    from counters import rebuild_counters
+    for Model, count in ((Venue, venues), (Artist, artists)):
+        db.session.execute(Model.__table__.insert(), [
+            {"id": id, "name": '{} {}'.format(Model.__name__, id), "city": 'San Francisco', "state": 'CA',
+             "image_link": 'https://example.com/{}.jpg'.format(id)} for id in range(1, count + 1)])
+    first = datetime.now().replace(microsecond=0) - timedelta(hours=3 * (shows // venues // 2))
+    for batch_start in range(0, shows, batch_size):
+        rows = []
+        for number in range(batch_start, min(shows, batch_start + batch_size)):
+            start_time = first + timedelta(hours=3 * (number // venues))
+            rows.append({"venue_id": number % venues + 1, "artist_id": number * 7919 % artists + 1,
+                         "start_time": start_time, "end_time": start_time + timedelta(hours=2)})
+        db.session.execute(Show.__table__.insert(), rows)
+        db.session.commit()
+        print('\rseeded {} shows'.format(batch_start + len(rows)), end='', flush=True)
+    print()
+    rebuild_counters()
+    db.session.commit()
+
+
+def time_query(app, function, ids):
+    timings = []
+    for id in ids:
+        with app.app_context():
+            started = time.perf_counter()
+            assert function(id) is not None
+            timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--shows', type=int, default=1000000, help='shows seeded into an empty database')
+    parser.add_argument('--venues', type=int, default=1000, help='venues seeded')
+    parser.add_argument('--artists', type=int, default=1000, help='artists seeded')
+    parser.add_argument('--samples', type=int, default=200, help='timed queries of each kind')
+    options = parser.parse_args()
+
+    import queries
+    from models import db, Venue, Artist, Show
+    app = bench_app()
+    with app.app_context():
+        db.create_all()
+        if not db.session.query(Show.query.exists()).scalar():
+            started = time.perf_counter()
+            seed(options.shows, options.venues, options.artists)
+            print('seeded in {:.1f}s'.format(time.perf_counter() - started))
+        shows = Show.query.count()
+        venue_ids = [id for id, in db.session.query(Venue.id)]
+        artist_ids = [id for id, in db.session.query(Artist.id)]
+
+    # The url without its credentials
+    print('{} shows in {}'.format(shows, app.config['SQLALCHEMY_DATABASE_URI'].split('@')[-1]))
+    random.seed(0)
+    print('{:<14} {:>8} {:>8} {:>8}'.format('query', 'p50 ms', 'p99 ms', 'max ms'))
+    for name, function, ids in (('venue shows', queries.venue_detail, venue_ids),
+                                ('artist shows', queries.artist_detail, artist_ids)):
+        timings = time_query(app, function, [random.choice(ids) for sample in range(options.samples)])
+        print('{:<14} {:8.2f} {:8.2f} {:8.2f}'.format(
+            name, percentile(timings, 50) * 1000, percentile(timings, 99) * 1000, max(timings) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+""" Time the cold start of the app in fresh interpreters: import app,
+    create_app() and the first test client request of the home page.
+
+    python bench/startup.py [--runs 10]
+"""
+import sys
+import json
+import argparse
+import subprocess
+import statistics
+import time
+
+PHASES = ['import app', 'create_app()', "first GET /"]
+
+
+def measure():
+    # Run in the child interpreter, every module is imported for the first time
+    from common import bench_app
+    started = time.perf_counter()
+    import app
+    imported = time.perf_counter()
+    flask_app = bench_app()
+    created = time.perf_counter()
+    response = flask_app.test_client().get('/')
+    served = time.perf_counter()
+    assert response.status_code == 200, response.status_code
+    print(json.dumps([imported - started, created - imported, served - created]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='fresh interpreters started')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    options = parser.parse_args()
+    if options.child:
+        return measure()
+
+    runs = []
+    for run in range(options.runs):
+        output = subprocess.run([sys.executable, __file__, '--child'], check=True, capture_output=True, text=True)
+        runs.append(json.loads(output.stdout.splitlines()[-1]))
+    print('{:<14} {:>10} {:>10}'.format('phase', 'median ms', 'min ms'))
+    for phase, samples in zip(PHASES + ['total'], list(zip(*runs)) + [[sum(run) for run in runs]]):
+        print('{:<14} {:10.1f} {:10.1f}'.format(phase, statistics.median(samples) * 1000, min(samples) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+from datetime import datetime
+from models import db, Artist, Venue, Show
+from counters import count_new_show_rows
+from conflicts import show_end_time, find_conflicts
+
+# region Batch show booking
+# A batch of shows is validated as a whole, artist and venue ids with one IN
+# query per table and venue bookings with one range query per venue, and
+# inserted in a single transaction. When any row is invalid nothing is
+# inserted and every row error is reported.
+
+REPEAT_FREQUENCIES = ('daily', 'weekly', 'monthly')
+
+
+def parse_show_lines(text):
+    """ The function read shows written one per line as
+        "artist_id, venue_id, start time[, duration in minutes]".
+
+    Args:
+       text: show lines (string)
+
+    Returns:
+       Shows as dicts of artist_id, venue_id, start_time and duration strings (list)
+    """
+    shows = []
+    for line in (text or '').splitlines():
+        if line.strip():
+            fields = [field.strip() for field in line.split(',', 3)]
+            shows.append(dict(zip(('artist_id', 'venue_id', 'start_time', 'duration'), fields + [''] * (4 - len(fields)))))
+    return shows
+
+
+def repeat_shows(artist_id, venue_id, start_time, duration, repeat, count, max_shows):
+    """ The function expand a recurrence into shows, e.g. every Friday for 12
+        weeks is a weekly repeat of 12 starting on a Friday.
+
+    Args:
+       artist_id: artist of every show
+       venue_id: venue of every show
+       start_time: start of the first show (datetime or string)
+       duration: length of every show in minutes (int)
+       repeat: 'daily', 'weekly' or 'monthly' (string)
+       count: number of shows (int)
+       max_shows: maximum number of shows in a batch (int)
+
+    Returns:
+       Shows as dicts of artist_id, venue_id and start_time (list), raise
+       ValueError for an invalid recurrence
+    """
+    from dateutil import rrule
+    if repeat not in REPEAT_FREQUENCIES:
+        raise ValueError('repeat must be one of ' + ', '.join(REPEAT_FREQUENCIES))
+    count = parse_id(count, 'count')
+    if not 1 <= count <= max_shows:
+        raise ValueError('count must be between 1 and {}'.format(max_shows))
+    frequency = {'daily': rrule.DAILY, 'weekly': rrule.WEEKLY, 'monthly': rrule.MONTHLY}[repeat]
+    return [{'artist_id': artist_id, 'venue_id': venue_id, 'start_time': start, 'duration': duration}
+            for start in rrule.rrule(frequency, dtstart=parse_start_time(start_time), count=count)]
+
+
+def parse_id(value, name):
+    if isinstance(value, bool):
+        raise ValueError('invalid {} {!r}'.format(name, value))
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        raise ValueError('invalid {} {!r}'.format(name, value))
+
+
+def parse_start_time(value):
+    import dateutil.parser
+    if not isinstance(value, datetime):
+        try:
+            value = dateutil.parser.parse(str(value))
+        except (ValueError, OverflowError):
+            raise ValueError('invalid start_time {!r}'.format(value))
+    if value.tzinfo:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+
+def create_show_batch(shows, max_shows):
+    """ The function validate and insert a batch of shows in one transaction.
+
+    Args:
+       shows: dicts of artist_id, venue_id, start_time and optional duration (list)
+       max_shows: maximum number of shows in a batch (int)
+
+    Returns:
+       Inserted shows as dicts (list) and errors as (row number, message) (list),
+       nothing is inserted when there are errors
+    """
+    if not shows:
+        return [], [(0, 'no shows given')]
+    if len(shows) > max_shows:
+        return [], [(0, 'at most {} shows per batch'.format(max_shows))]
+    rows = []
+    errors = []
+    for number, show in enumerate(shows, 1):
+        try:
+            start_time = parse_start_time(show.get('start_time'))
+            rows.append((number, {'artist_id': parse_id(show.get('artist_id'), 'artist_id'),
+                                  'venue_id': parse_id(show.get('venue_id'), 'venue_id'),
+                                  'start_time': start_time,
+                                  'end_time': show_end_time(start_time, show.get('duration'))}))
+        except ValueError as error:
+            errors.append((number, str(error)))
+    artist_ids = {id for id, in db.session.query(Artist.id).filter(
+        Artist.id.in_({row['artist_id'] for number, row in rows}))}
+    venue_ids = {id for id, in db.session.query(Venue.id).filter(
+        Venue.id.in_({row['venue_id'] for number, row in rows}))}
+    for number, row in rows:
+        if row['artist_id'] not in artist_ids:
+            errors.append((number, 'artist {} not found'.format(row['artist_id'])))
+        if row['venue_id'] not in venue_ids:
+            errors.append((number, 'venue {} not found'.format(row['venue_id'])))
+    if errors:
+        return [], sorted(errors)
+    for position in find_conflicts([row for number, row in rows]):
+        number, row = rows[position]
+        errors.append((number, 'venue {} is already booked at {}'.format(row['venue_id'], row['start_time'])))
+    if errors:
+        return [], sorted(errors)
+    now = datetime.now()
+    rows = [row for number, row in rows]
+    for row in rows:
+        row['is_past'] = row['start_time'] <= now
+    db.session.execute(Show.__table__.insert(), rows)
+    count_new_show_rows(rows)
+    db.session.commit()
+    return rows, []
+
+# endregion
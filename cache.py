@@ -0,0 +1,164 @@
+import time
+import threading
+from functools import wraps
+from collections import OrderedDict
+from flask import g, session, request, current_app
+
+# region Cache backends
+
+class LRUCache:
+    """ In process cache with least recently used eviction and time to live.
+
+    Args:
+       max_entries: maximum number of entries kept (int)
+       ttl: seconds an entry stays valid (int)
+    """
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, *keys):
+        with self.lock:
+            for key in keys:
+                self.entries.pop(key, None)
+
+    def stats(self):
+        return {"backend": "lru", "entries": len(self.entries), "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+
+class RedisCache:
+    """ Cache shared between workers stored in redis, entries expire after ttl
+        and eviction is left to the redis maxmemory policy.
+
+    Args:
+       url: redis url (string)
+       ttl: seconds an entry stays valid (int)
+    """
+
+    def __init__(self, url, ttl, prefix='fyyur:'):
+        import redis
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self.client.get(self.prefix + key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value.decode()
+
+    def set(self, key, value):
+        self.client.set(self.prefix + key, value, ex=self.ttl)
+
+    def delete(self, *keys):
+        if keys:
+            self.client.delete(*[self.prefix + key for key in keys])
+
+    def stats(self):
+        return {"backend": "redis", "hits": self.hits, "misses": self.misses, "evictions": None}
+
+# endregion
+
+# region Page cache
+
+class PageCache:
+    """ Read through cache of rendered pages keyed by entity kind and id, the
+        backend of each app is made by init_app.
+    """
+
+    def init_app(self, app):
+        """ The function make the cache backend of the app.
+
+        Args:
+           app: Flask app with CACHE_TYPE ('lru', 'redis' or 'null'), CACHE_TTL,
+                CACHE_MAX_ENTRIES and CACHE_REDIS_URL config
+        """
+        config = app.config
+        if config['CACHE_TYPE'] == 'null':
+            backend = None
+        elif config['CACHE_TYPE'] == 'redis':
+            backend = RedisCache(config['CACHE_REDIS_URL'], config['CACHE_TTL'])
+        else:
+            backend = LRUCache(config['CACHE_MAX_ENTRIES'], config['CACHE_TTL'])
+        app.extensions['page_cache'] = backend
+
+    @property
+    def backend(self):
+        return current_app.extensions['page_cache']
+
+    def cached(self, kind, id_arg):
+        """ The function decorate a view so its rendered page is served from
+            the cache, pages rendered with pending flash messages or query
+            arguments are not cached. A miss is rendered from the primary,
+            a page read from a lagging replica would outlive the lag.
+
+        Args:
+           kind: entity kind used in the key, e.g. 'venue' (string)
+           id_arg: name of the view argument holding the entity id (string)
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(**kwargs):
+                backend = self.backend
+                if backend is None or '_flashes' in session or request.args:
+                    return view(**kwargs)
+                key = '{}:{}'.format(kind, kwargs[id_arg])
+                page = backend.get(key)
+                if page is None:
+                    g.pop('replica_bind', None)
+                    page = view(**kwargs)
+                    backend.set(key, page)
+                return page
+            return wrapper
+        return decorator
+
+    def invalidate(self, kind, *ids):
+        """ The function remove cached pages of the given entities.
+
+        Args:
+           kind: entity kind used in the key, e.g. 'venue' (string)
+           ids: entity ids
+        """
+        if self.backend is not None:
+            self.backend.delete(*['{}:{}'.format(kind, id) for id in ids])
+
+    def stats(self):
+        if self.backend is None:
+            return {"backend": "null"}
+        return self.backend.stats()
+
+
+page_cache = PageCache()
+
+# endregion
@@ -0,0 +1,108 @@
+import csv
+import click
+from datetime import datetime, timedelta
+from flask import current_app
+from flask.cli import with_appcontext
+from counters import roll_over_shows, rebuild_counters
+from deletion import delete_venues
+from archive import archive_shows
+from jobs import jobs
+from models import Venue
+from exporter import EXPORT_FORMATS, parse_export_filters, export_query, export_shows
+
+# region Commands
+# Registered on the app by create_app, the importer is only loaded when the
+# import command runs.
+
+@click.command('roll-over-shows')
+@with_appcontext
+def roll_over_shows_command():
+    """ Move shows that have started from the upcoming to the past counters. """
+    click.echo('{} shows moved to past.'.format(roll_over_shows()))
+
+
+@click.command('rebuild-counters')
+@with_appcontext
+def rebuild_counters_command():
+    """ Recompute venue and artist show counters from the Shows and ShowsArchive tables. """
+    rebuild_counters()
+    click.echo('Show counters rebuilt.')
+
+
+@click.command('import')
+@with_appcontext
+@click.argument('kind', type=click.Choice(['venues', 'artists', 'shows']))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--batch-size', default=1000, show_default=True, help='Records per transaction.')
+@click.option('--rejects', type=click.Path(dir_okay=False), help='Write rejected records to this CSV file.')
+def import_command(kind, path, batch_size, rejects):
+    """ Bulk import venues, artists or shows from a .csv or .jsonl file. """
+    from importer import import_file
+    report = import_file(kind, path, batch_size)
+    click.echo('{} {} imported in {:.1f}s ({:.0f} rows/s), {} rejected.'.format(
+        report.imported, kind, report.seconds, report.rows_per_second, len(report.rejected)))
+    if rejects:
+        with open(rejects, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['line', 'reason'])
+            writer.writerows(report.rejected)
+    else:
+        for line_number, reason in report.rejected[:20]:
+            click.echo('  line {}: {}'.format(line_number, reason))
+
+
+@click.command('export-shows')
+@with_appcontext
+@click.argument('format', type=click.Choice(list(EXPORT_FORMATS)))
+@click.option('--output', type=click.File('w'), default='-', help='Output file, stdout by default.')
+@click.option('--start', help='Shows starting at or after this ISO date.')
+@click.option('--end', help='Shows starting before this ISO date.')
+@click.option('--venue-id', type=int)
+@click.option('--artist-id', type=int)
+@click.option('--archived/--no-archived', default=True, show_default=True, help='Include the archived shows.')
+def export_shows_command(format, output, archived, **filters):
+    """ Stream the show calendar as csv, ndjson or ics. """
+    for chunk in export_shows(format, export_query(archived=archived, **parse_export_filters(filters))):
+        click.echo(chunk, file=output, nl=False)
+
+
+@click.command('delete-venues')
+@with_appcontext
+@click.option('--state', required=True, help='State of the venues.')
+@click.option('--city', help='City of the venues, all cities of the state by default.')
+@click.confirmation_option(prompt='Delete the matching venues and all their shows?')
+def delete_venues_command(state, city):
+    """ Delete the venues of a city or state with their shows. """
+    criterion = [Venue.state == state]
+    if city:
+        criterion.append(Venue.city == city)
+    deleted = delete_venues(*criterion)
+    click.echo('{} venues and {} shows deleted.'.format(deleted["deleted"], deleted["shows_deleted"]))
+
+
+@click.command('archive-shows')
+@with_appcontext
+@click.option('--days', type=int, help='Archive shows older than this many days, SHOW_ARCHIVE_AFTER_DAYS by default.')
+@click.option('--batch-size', default=1000, show_default=True, help='Shows per transaction.')
+def archive_shows_command(days, batch_size):
+    """ Move past shows older than the given days to the ShowsArchive table. """
+    if days is None:
+        days = current_app.config['SHOW_ARCHIVE_AFTER_DAYS']
+    roll_over_shows()
+    archived = archive_shows(datetime.now() - timedelta(days=days), batch_size)
+    click.echo('{} shows archived.'.format(archived))
+
+
+@click.command('run-jobs')
+@with_appcontext
+@click.option('--threads', default=2, show_default=True, help='Worker threads.')
+@click.option('--burst', is_flag=True, help='Exit once no job is due.')
+def run_jobs_command(threads, burst):
+    """ Run background jobs from the job table until interrupted. """
+    jobs.runner.run(threads, burst)
+
+
+COMMANDS = [roll_over_shows_command, rebuild_counters_command, import_command, export_shows_command,
+            delete_venues_command, archive_shows_command, run_jobs_command]
+
+# endregion
@@ -1,8 +1,15 @@
 import os
-SECRET_KEY = os.urandom(32)
+from keys import load_secret_key, load_fallback_keys
 # Grabs the folder where the script runs.
 basedir = os.path.abspath(os.path.dirname(__file__))
 
+# Session and CSRF signing key shared by all workers, from the SECRET_KEY
+# environment variable or the key file. Rotate by moving the old key to
+# SECRET_KEY_FALLBACKS (comma separated) or the fallback file.
+SECRET_KEY = load_secret_key(os.environ.get('SECRET_KEY_FILE', os.path.join(basedir, '.secret_key')))
+SECRET_KEY_FALLBACKS = load_fallback_keys(
+    os.environ.get('SECRET_KEY_FALLBACKS_FILE', os.path.join(basedir, '.secret_key_fallbacks')))
+
 # Enable debug mode.
 DEBUG = True
 
@@ -12,3 +19,74 @@ DEBUG = True
 # TODO IMPLEMENT DATABASE URL
 SQLALCHEMY_DATABASE_URI = 'postgresql://postgres@localhost:5432/fyyur'
 SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+# Connection pool of every engine, pre ping drops connections closed by the server
+SQLALCHEMY_ENGINE_OPTIONS = {
+    'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+    'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+    'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 30)),
+    'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+    'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', '1') == '1',
+}
+
+# Comma separated replica urls used by the read only views, empty reads the primary
+SQLALCHEMY_REPLICA_URIS = [uri for uri in os.environ.get('SQLALCHEMY_REPLICA_URIS', '').split(',') if uri]
+# Seconds a client reads from the primary after a request that wrote
+REPLICA_STICKY_SECONDS = 5
+
+# Listing pages (venues, artists, shows) page size, overridable with ?per_page=
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Maximum number of results of venue and artist search
+SEARCH_RESULT_LIMIT = 50
+
+# Maximum number of shows created by one batch submission
+SHOW_BATCH_MAX = 500
+
+# Past shows older than this many days are moved to ShowsArchive by archive-shows
+SHOW_ARCHIVE_AFTER_DAYS = 365
+
+# Venue and artist page cache: 'lru' (per process), 'redis' (shared) or 'null'
+CACHE_TYPE = os.environ.get('CACHE_TYPE', 'lru')
+CACHE_TTL = 60
+CACHE_MAX_ENTRIES = 1024
+CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+
+# Seconds clients may reuse a /api/v1 response before revalidating with its ETag
+API_CACHE_MAX_AGE = 30
+# Seconds clients may reuse /api/v1/choices, the choice tables only change on deploy
+CHOICES_CACHE_MAX_AGE = 86400
+
+# Venue and artist image thumbnails served by /img/<kind>/<id>/<size>, sizes
+# are maximum widths in pixels. Local image links are read from
+# IMAGE_LOCAL_ROOT when it is set, other links must be public http(s) urls.
+IMAGE_SIZES = {'tile': 320, 'detail': 640}
+IMAGE_QUALITY = 80
+IMAGE_CACHE_DIR = os.environ.get('IMAGE_CACHE_DIR', os.path.join(basedir, 'image_cache'))
+IMAGE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+IMAGE_LOCAL_ROOT = os.environ.get('IMAGE_LOCAL_ROOT')
+IMAGE_FETCH_TIMEOUT = 10
+IMAGE_MAX_SOURCE_BYTES = 20 * 1024 * 1024
+# Seconds clients may reuse a thumbnail requested without its version digest
+IMAGE_MAX_AGE = 3600
+
+# Background jobs run after a request committed, stored in a SQLite file shared
+# by the processes of the host. Each web process runs JOBS_WORKERS threads, 0
+# leaves the jobs to `flask run-jobs`, which needs CACHE_TYPE 'redis' for the
+# page cache invalidation jobs to reach the web processes.
+JOBS_DATABASE = os.environ.get('JOBS_DATABASE', os.path.join(basedir, 'jobs.sqlite'))
+JOBS_WORKERS = int(os.environ.get('JOBS_WORKERS', 2))
+JOBS_MAX_ATTEMPTS = 5
+JOBS_RETRY_BACKOFF = 2
+JOBS_TIMEOUT = 300
+JOBS_POLL_INTERVAL = 1
+
+# Requests executing more SQL statements than this are logged as a warning
+MAX_QUERIES_PER_REQUEST = 20
+
+# Logging (when not in debug), records are written by a background thread
+LOG_FILE = os.path.join(basedir, 'error.log')
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+LOG_QUEUE_SIZE = 10000
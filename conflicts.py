@@ -0,0 +1,88 @@
+from bisect import bisect_right
+from itertools import accumulate
+from datetime import timedelta
+from models import db, Show, SHOW_DEFAULT_DURATION, SHOW_MAX_DURATION
+
+# region Venue booking conflicts
+# Two shows at a venue overlap when each starts before the other ends. As no
+# show lasts longer than SHOW_MAX_DURATION, every show overlapping [start, end)
+# starts in [start - SHOW_MAX_DURATION, end), a range of the (venue_id,
+# start_time) index. Postgres also enforces it with an exclusion constraint.
+
+def show_end_time(start_time, duration=None):
+    """ The function compute the end of a show from its duration in minutes.
+
+    Args:
+       start_time: start of the show (datetime)
+       duration: length in minutes, SHOW_DEFAULT_DURATION when empty (int or string)
+
+    Returns:
+       End time (datetime), raise ValueError for an invalid duration
+    """
+    if duration in (None, ''):
+        return start_time + SHOW_DEFAULT_DURATION
+    try:
+        length = timedelta(minutes=int(duration))
+    except (TypeError, ValueError):
+        raise ValueError('invalid duration {!r}'.format(duration))
+    if not timedelta(0) < length <= SHOW_MAX_DURATION:
+        raise ValueError('duration must be between 1 and {} minutes'.format(
+            int(SHOW_MAX_DURATION.total_seconds() // 60)))
+    return start_time + length
+
+
+class VenueSchedule:
+    """ Booked shows of one venue sorted by start, each with the latest end of
+        the bookings up to it. It is built once from the sorted query rows, so
+        an overlap check is one binary search, O(log n).
+
+    Args:
+       booked: (start, end) of the booked shows ordered by start (list)
+    """
+
+    def __init__(self, booked):
+        self.starts = [start for start, end in booked]
+        self.reach = list(accumulate((end for start, end in booked), max))
+
+    def overlaps(self, start, end):
+        index = bisect_right(self.starts, start)
+        if index and self.reach[index - 1] > start:
+            return True
+        return index < len(self.starts) and self.starts[index] < end
+
+
+def find_conflicts(rows):
+    """ The function find the new shows that overlap a booked show of their
+        venue or another new show. Booked shows are read with one index range
+        query per venue. New shows are sorted once and swept by start, so of
+        two overlapping new shows the one starting first (or given first when
+        they start together) is kept, in O(n log n) for the batch.
+
+    Args:
+       rows: new shows as dicts with venue_id, start_time and end_time (list)
+
+    Returns:
+       Positions of the conflicting rows (set)
+    """
+    rows_by_venue = {}
+    for position, row in enumerate(rows):
+        rows_by_venue.setdefault(row['venue_id'], []).append(position)
+    conflicts = set()
+    for venue_id, positions in rows_by_venue.items():
+        schedule = VenueSchedule(db.session.query(Show.start_time, Show.end_time).filter(
+            Show.venue_id == venue_id,
+            Show.start_time >= min(rows[position]['start_time'] for position in positions) - SHOW_MAX_DURATION,
+            Show.start_time < max(rows[position]['end_time'] for position in positions)).order_by(
+            Show.start_time).all())
+        # Latest end of the new shows kept so far, all of which start earlier
+        reach = None
+        for position in sorted(positions, key=lambda position: (rows[position]['start_time'], position)):
+            row = rows[position]
+            if schedule.overlaps(row['start_time'], row['end_time']) or (
+                    reach is not None and reach > row['start_time']):
+                conflicts.add(position)
+            else:
+                reach = row['end_time'] if reach is None else max(reach, row['end_time'])
+    return conflicts
+
+# endregion
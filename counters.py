@@ -0,0 +1,115 @@
+from datetime import datetime
+from collections import Counter
+from models import db, Artist, Venue, Show, ShowArchive
+
+# region Show counters
+# Venue and Artist carry upcoming_shows_count and past_shows_count so listing
+# and search pages do not count Shows. Show.is_past records which counter a
+# show is in, roll_over_shows moves started shows from upcoming to past.
+
+def add_to_counter(Model, id, column, amount):
+    Model.query.filter_by(id=id).update(
+        {column: column + amount}, synchronize_session=False)
+
+
+def count_new_show(show, now=None):
+    """ The function add a new show to its venue and artist counters, call it
+        in the same transaction that inserts the show.
+
+    Args:
+       show: new Show with venue_id, artist_id and start_time set
+       now: time that splits past from upcoming (datetime)
+    """
+    show.is_past = show.start_time <= (now or datetime.now())
+    for Model, id in ((Venue, show.venue_id), (Artist, show.artist_id)):
+        column = Model.past_shows_count if show.is_past else Model.upcoming_shows_count
+        add_to_counter(Model, id, column, 1)
+
+
+def count_new_show_rows(rows):
+    """ The function add bulk inserted shows to their venue and artist counters
+        with one update per venue and artist, call it in the inserting transaction.
+
+    Args:
+       rows: new shows as dicts with venue_id, artist_id and is_past (list)
+    """
+    for Model, fk in ((Venue, 'venue_id'), (Artist, 'artist_id')):
+        counts = Counter((row[fk], row['is_past']) for row in rows)
+        for (id, is_past), count in counts.items():
+            column = Model.past_shows_count if is_past else Model.upcoming_shows_count
+            add_to_counter(Model, id, column, count)
+
+
+def uncount_shows(*criterion, archived=False):
+    """ The function subtract the shows matching criterion from their venue and
+        artist counters, call it in the same transaction before deleting them.
+
+    Args:
+       criterion: filters on Show, or on ShowArchive when archived, selecting the shows to be deleted
+       archived: count archived shows, which are all past (bool)
+    """
+    for Model, fk in ((Venue, 'venue_id'), (Artist, 'artist_id')):
+        if archived:
+            counts = db.session.query(getattr(ShowArchive, fk), db.true(), db.func.count(ShowArchive.id)).filter(
+                *criterion).group_by(getattr(ShowArchive, fk)).all()
+        else:
+            counts = db.session.query(getattr(Show, fk), Show.is_past, db.func.count(Show.id)).filter(
+                *criterion).group_by(getattr(Show, fk), Show.is_past).all()
+        for id, is_past, count in counts:
+            column = Model.past_shows_count if is_past else Model.upcoming_shows_count
+            add_to_counter(Model, id, column, -count)
+
+
+def roll_over_shows(now=None, batch_size=1000):
+    """ The function move shows that started since the last roll over from the
+        upcoming to the past counters, committing every batch so it can be
+        stopped and resumed.
+
+    Args:
+       now: time that splits past from upcoming (datetime)
+       batch_size: number of shows moved per transaction (int)
+
+    Returns:
+       Number of shows moved (int)
+    """
+    now = now or datetime.now()
+    moved = 0
+    while True:
+        ids = [id for id, in db.session.query(Show.id).filter(
+            Show.is_past == False, Show.start_time <= now).order_by(Show.id).limit(batch_size)]
+        if not ids:
+            return moved
+        for Model, fk in ((Venue, Show.venue_id), (Artist, Show.artist_id)):
+            counts = db.session.query(fk, db.func.count(Show.id)).filter(
+                Show.id.in_(ids)).group_by(fk).all()
+            for id, count in counts:
+                Model.query.filter_by(id=id).update({
+                    Model.upcoming_shows_count: Model.upcoming_shows_count - count,
+                    Model.past_shows_count: Model.past_shows_count + count},
+                    synchronize_session=False)
+        Show.query.filter(Show.id.in_(ids)).update(
+            {Show.is_past: True}, synchronize_session=False)
+        db.session.commit()
+        moved += len(ids)
+
+
+def rebuild_counters(now=None):
+    """ The function recompute every show counter and Show.is_past from the
+        Shows and ShowsArchive tables to repair drift.
+
+    Args:
+       now: time that splits past from upcoming (datetime)
+    """
+    now = now or datetime.now()
+    Show.query.update({Show.is_past: Show.start_time <= now}, synchronize_session=False)
+    for Model, fk in ((Venue, 'venue_id'), (Artist, 'artist_id')):
+        def count(is_past):
+            return db.select(db.func.count(Show.id)).where(
+                getattr(Show, fk) == Model.id, Show.is_past == is_past).scalar_subquery()
+        archived = db.select(db.func.count(ShowArchive.id)).where(
+            getattr(ShowArchive, fk) == Model.id).scalar_subquery()
+        Model.query.update({Model.upcoming_shows_count: count(False),
+                            Model.past_shows_count: count(True) + archived}, synchronize_session=False)
+    db.session.commit()
+
+# endregion
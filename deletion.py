@@ -0,0 +1,53 @@
+from models import db, Artist, Venue, Show, ShowArchive
+from counters import uncount_shows
+from cache import page_cache
+
+# region Set based deletes
+# Venues and artists are deleted with one DELETE statement, their shows by
+# the ON DELETE CASCADE of the Shows and ShowsArchive foreign keys, so no row
+# is loaded into the session. Counters of the other side of the shows are decremented first.
+
+def delete_entities(Model, fk, other_fk, kind, other_kind, *criterion):
+    ids = db.session.query(Model.id).filter(*criterion)
+    shows = fk.in_(ids.subquery().select())
+    archived = getattr(ShowArchive, fk.key).in_(ids.subquery().select())
+    other_ids = [id for id, in db.session.query(other_fk).filter(shows).distinct()]
+    other_ids += [id for id, in db.session.query(getattr(ShowArchive, other_fk.key)).filter(archived).distinct()]
+    deleted_ids = [id for id, in ids]
+    shows_deleted = db.session.query(db.func.count(Show.id)).filter(shows).scalar()
+    shows_deleted += db.session.query(db.func.count(ShowArchive.id)).filter(archived).scalar()
+    uncount_shows(shows)
+    uncount_shows(archived, archived=True)
+    deleted = Model.query.filter(*criterion).delete(synchronize_session=False)
+    db.session.commit()
+    page_cache.invalidate(kind, *deleted_ids)
+    page_cache.invalidate(other_kind, *other_ids)
+    return {"deleted": deleted, "shows_deleted": shows_deleted}
+
+
+def delete_venues(*criterion):
+    """ The function delete the venues matching criterion with their shows
+        and commit.
+
+    Args:
+       criterion: filters on Venue
+
+    Returns:
+       Number of deleted venues and shows (dict)
+    """
+    return delete_entities(Venue, Show.venue_id, Show.artist_id, 'venue', 'artist', *criterion)
+
+
+def delete_artists(*criterion):
+    """ The function delete the artists matching criterion with their shows
+        and commit.
+
+    Args:
+       criterion: filters on Artist
+
+    Returns:
+       Number of deleted artists and shows (dict)
+    """
+    return delete_entities(Artist, Show.artist_id, Show.venue_id, 'artist', 'venue', *criterion)
+
+# endregion
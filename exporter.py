@@ -0,0 +1,110 @@
+import io
+import csv
+import json
+from datetime import datetime
+from models import db, Show, ShowArchive
+from queries import show_rows
+
+# region Show calendar export
+# Shows are read through a server side cursor (yield_per) and written out row
+# by row, so memory stays flat whatever the size of the Shows table.
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+    'ics': 'text/calendar',
+}
+EXPORT_COLUMNS = ['id', 'start_time', 'end_time', 'venue_id', 'venue_name', 'artist_id', 'artist_name']
+
+
+def parse_export_filters(args):
+    """ The function read the export filters from request args or cli options.
+
+    Args:
+       args: mapping with optional start, end (iso dates), venue_id and artist_id
+
+    Returns:
+       Filters (dict), raise ValueError for invalid values
+    """
+    import dateutil.parser
+    filters = {}
+    for name in ('start', 'end'):
+        if args.get(name):
+            filters[name] = dateutil.parser.isoparse(str(args[name]))
+    for name in ('venue_id', 'artist_id'):
+        if args.get(name):
+            filters[name] = int(args[name])
+    return filters
+
+
+def export_query(start=None, end=None, venue_id=None, artist_id=None, archived=True, batch_size=1000):
+    """ The function build the streaming query of shows ordered by start time.
+
+    Args:
+       start: shows starting at or after (datetime)
+       end: shows starting before (datetime)
+       venue_id: shows at this venue (int)
+       artist_id: shows of this artist (int)
+       archived: also export the shows of the ShowsArchive table (bool)
+       batch_size: rows fetched from the cursor at a time (int)
+
+    Returns:
+       Query of show id, start_time, end_time, venue id and name, artist id and name
+    """
+    parts = []
+    for Model in (Show, ShowArchive) if archived else (Show,):
+        criterion = []
+        if start:
+            criterion.append(Model.start_time >= start)
+        if end:
+            criterion.append(Model.start_time < end)
+        if venue_id:
+            criterion.append(Model.venue_id == venue_id)
+        if artist_id:
+            criterion.append(Model.artist_id == artist_id)
+        parts.append(show_rows(Model, *criterion))
+    shows = db.union_all(*parts).subquery('shows')
+    return db.session.query(shows).order_by(shows.c.start_time, shows.c.id).yield_per(batch_size)
+
+
+def ics_text(value):
+    return (value or '').replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\n', '\\n')
+
+
+def export_shows(format, query):
+    """ The function stream the shows of the query in the given format.
+
+    Args:
+       format: 'csv', 'ndjson' or 'ics' (string)
+       query: query made by export_query
+
+    Returns:
+       Generator of text chunks
+    """
+    if format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        for row in query:
+            writer.writerow([row.id, row.start_time.isoformat(), row.end_time.isoformat(), row.venue_id, row.venue_name,
+                             row.artist_id, row.artist_name])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    elif format == 'ndjson':
+        for row in query:
+            yield json.dumps({"id": row.id, "start_time": row.start_time.isoformat(),
+                              "end_time": row.end_time.isoformat(),
+                              "venue_id": row.venue_id, "venue_name": row.venue_name,
+                              "artist_id": row.artist_id, "artist_name": row.artist_name}) + '\n'
+    elif format == 'ics':
+        stamp = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
+        yield 'BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Fyyur//Shows//EN\r\n'
+        for row in query:
+            yield ('BEGIN:VEVENT\r\nUID:show-{}@fyyur\r\nDTSTAMP:{}\r\nDTSTART:{}\r\nDTEND:{}\r\n'
+                   'SUMMARY:{} at {}\r\nEND:VEVENT\r\n').format(
+                row.id, stamp, row.start_time.strftime('%Y%m%dT%H%M%S'), row.end_time.strftime('%Y%m%dT%H%M%S'),
+                ics_text(row.artist_name), ics_text(row.venue_name))
+        yield 'END:VCALENDAR\r\n'
+
+# endregion
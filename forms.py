@@ -1,7 +1,92 @@
 from datetime import datetime
+from functools import lru_cache
 from flask_wtf import Form
-from wtforms import StringField, SelectField, SelectMultipleField, DateTimeField
-from wtforms.validators import DataRequired, AnyOf, URL
+from markupsafe import Markup
+from wtforms import StringField, SelectField, SelectMultipleField, DateTimeField, TextAreaField, IntegerField
+from wtforms.validators import DataRequired, AnyOf, URL, Optional
+from wtforms.widgets import Select, html_params
+
+# region Choices
+# Choice tables are shared immutable tuples, the <option> html of each table is
+# rendered once per process and only the selected options are swapped in.
+
+STATE_CHOICES = (
+    ('AL', 'AL'), ('AK', 'AK'), ('AZ', 'AZ'), ('AR', 'AR'), ('CA', 'CA'), ('CO', 'CO'),
+    ('CT', 'CT'), ('DE', 'DE'), ('DC', 'DC'), ('FL', 'FL'), ('GA', 'GA'), ('HI', 'HI'),
+    ('ID', 'ID'), ('IL', 'IL'), ('IN', 'IN'), ('IA', 'IA'), ('KS', 'KS'), ('KY', 'KY'),
+    ('LA', 'LA'), ('ME', 'ME'), ('MT', 'MT'), ('NE', 'NE'), ('NV', 'NV'), ('NH', 'NH'),
+    ('NJ', 'NJ'), ('NM', 'NM'), ('NY', 'NY'), ('NC', 'NC'), ('ND', 'ND'), ('OH', 'OH'),
+    ('OK', 'OK'), ('OR', 'OR'), ('MD', 'MD'), ('MA', 'MA'), ('MI', 'MI'), ('MN', 'MN'),
+    ('MS', 'MS'), ('MO', 'MO'), ('PA', 'PA'), ('RI', 'RI'), ('SC', 'SC'), ('SD', 'SD'),
+    ('TN', 'TN'), ('TX', 'TX'), ('UT', 'UT'), ('VT', 'VT'), ('VA', 'VA'), ('WA', 'WA'),
+    ('WV', 'WV'), ('WI', 'WI'), ('WY', 'WY'),
+)
+
+GENRE_CHOICES = (
+    ('Alternative', 'Alternative'), ('Blues', 'Blues'), ('Classical', 'Classical'),
+    ('Country', 'Country'), ('Electronic', 'Electronic'), ('Folk', 'Folk'),
+    ('Funk', 'Funk'), ('Hip-Hop', 'Hip-Hop'), ('Heavy Metal', 'Heavy Metal'),
+    ('Instrumental', 'Instrumental'), ('Jazz', 'Jazz'), ('Musical Theatre', 'Musical Theatre'),
+    ('Pop', 'Pop'), ('Punk', 'Punk'), ('R&B', 'R&B'),
+    ('Reggae', 'Reggae'), ('Rock n Roll', 'Rock n Roll'), ('Soul', 'Soul'),
+    ('Other', 'Other'),
+)
+
+
+@lru_cache(maxsize=None)
+def option_html(choices):
+    """ The function render the <option> tags of a choice table once, in the
+        unselected and selected variants.
+
+    Args:
+       choices: choice table of (value, label) pairs (tuple)
+
+    Returns:
+       Value, unselected and selected option html of every choice (tuple)
+    """
+    return tuple((str(value), Select.render_option(value, label, False), Select.render_option(value, label, True))
+                 for value, label in choices)
+
+
+class CachedSelect(Select):
+    """ Select widget rendering the options of a choice table from the
+        option_html cache.
+    """
+
+    def __call__(self, field, **kwargs):
+        kwargs.setdefault('id', field.id)
+        if self.multiple:
+            kwargs['multiple'] = True
+        if 'required' not in kwargs and 'required' in getattr(field, 'flags', []):
+            kwargs['required'] = True
+        if self.multiple:
+            selected = {str(value) for value in field.data or ()}
+        else:
+            selected = {str(field.data)} if field.data is not None else set()
+        html = ['<select %s>' % html_params(name=field.name, **kwargs)]
+        for value, option, selected_option in option_html(tuple(field.choices)):
+            html.append(selected_option if value in selected else option)
+        html.append('</select>')
+        return Markup(''.join(html))
+
+# endregion
+
+def ValidPhoneNumber(phone):
+    """ The function check string phone number validation in type xxx-xxx-xxxx
+        where x is integer
+    
+    Args:
+       phone: phone number (string)  
+
+    Returns:
+       True (is valid) or False (not valid)  
+    """
+    if (len(phone)) != 12:
+        return False
+    if(phone[3]!='-' or phone[7]!='-'):
+        return False
+    Phone = phone.replace('-','')
+    return Phone.isnumeric()
 
 class ShowForm(Form):
     artist_id = StringField(
@@ -15,6 +100,37 @@ class ShowForm(Form):
         validators=[DataRequired()],
         default= datetime.today()
     )
+    duration = IntegerField(
+        'duration', validators=[Optional()], default=120
+    )
+
+REPEAT_CHOICES = (
+    ('', 'Does not repeat'), ('daily', 'Daily'), ('weekly', 'Weekly'), ('monthly', 'Monthly'),
+)
+
+class ShowBatchForm(Form):
+    shows = TextAreaField(
+        # one show per line: artist_id, venue_id, start time
+        'shows'
+    )
+    artist_id = StringField(
+        'artist_id'
+    )
+    venue_id = StringField(
+        'venue_id'
+    )
+    start_time = DateTimeField(
+        'start_time', validators=[Optional()]
+    )
+    duration = IntegerField(
+        'duration', validators=[Optional()], default=120
+    )
+    repeat = SelectField(
+        'repeat', choices=REPEAT_CHOICES, widget=CachedSelect()
+    )
+    count = IntegerField(
+        'count', validators=[Optional()]
+    )
 
 class VenueForm(Form):
     name = StringField(
@@ -25,59 +141,7 @@ class VenueForm(Form):
     )
     state = SelectField(
         'state', validators=[DataRequired()],
-        choices=[
-            ('AL', 'AL'),
-            ('AK', 'AK'),
-            ('AZ', 'AZ'),
-            ('AR', 'AR'),
-            ('CA', 'CA'),
-            ('CO', 'CO'),
-            ('CT', 'CT'),
-            ('DE', 'DE'),
-            ('DC', 'DC'),
-            ('FL', 'FL'),
-            ('GA', 'GA'),
-            ('HI', 'HI'),
-            ('ID', 'ID'),
-            ('IL', 'IL'),
-            ('IN', 'IN'),
-            ('IA', 'IA'),
-            ('KS', 'KS'),
-            ('KY', 'KY'),
-            ('LA', 'LA'),
-            ('ME', 'ME'),
-            ('MT', 'MT'),
-            ('NE', 'NE'),
-            ('NV', 'NV'),
-            ('NH', 'NH'),
-            ('NJ', 'NJ'),
-            ('NM', 'NM'),
-            ('NY', 'NY'),
-            ('NC', 'NC'),
-            ('ND', 'ND'),
-            ('OH', 'OH'),
-            ('OK', 'OK'),
-            ('OR', 'OR'),
-            ('MD', 'MD'),
-            ('MA', 'MA'),
-            ('MI', 'MI'),
-            ('MN', 'MN'),
-            ('MS', 'MS'),
-            ('MO', 'MO'),
-            ('PA', 'PA'),
-            ('RI', 'RI'),
-            ('SC', 'SC'),
-            ('SD', 'SD'),
-            ('TN', 'TN'),
-            ('TX', 'TX'),
-            ('UT', 'UT'),
-            ('VT', 'VT'),
-            ('VA', 'VA'),
-            ('WA', 'WA'),
-            ('WV', 'WV'),
-            ('WI', 'WI'),
-            ('WY', 'WY'),
-        ]
+        choices=STATE_CHOICES, widget=CachedSelect()
     )
     address = StringField(
         'address', validators=[DataRequired()]
@@ -91,27 +155,7 @@ class VenueForm(Form):
     genres = SelectMultipleField(
         # TODO implement enum restriction
         'genres', validators=[DataRequired()],
-        choices=[
-            ('Alternative', 'Alternative'),
-            ('Blues', 'Blues'),
-            ('Classical', 'Classical'),
-            ('Country', 'Country'),
-            ('Electronic', 'Electronic'),
-            ('Folk', 'Folk'),
-            ('Funk', 'Funk'),
-            ('Hip-Hop', 'Hip-Hop'),
-            ('Heavy Metal', 'Heavy Metal'),
-            ('Instrumental', 'Instrumental'),
-            ('Jazz', 'Jazz'),
-            ('Musical Theatre', 'Musical Theatre'),
-            ('Pop', 'Pop'),
-            ('Punk', 'Punk'),
-            ('R&B', 'R&B'),
-            ('Reggae', 'Reggae'),
-            ('Rock n Roll', 'Rock n Roll'),
-            ('Soul', 'Soul'),
-            ('Other', 'Other'),
-        ]
+        choices=GENRE_CHOICES, widget=CachedSelect(multiple=True)
     )
     facebook_link = StringField(
         'facebook_link', validators=[URL()]
@@ -126,59 +170,7 @@ class ArtistForm(Form):
     )
     state = SelectField(
         'state', validators=[DataRequired()],
-        choices=[
-            ('AL', 'AL'),
-            ('AK', 'AK'),
-            ('AZ', 'AZ'),
-            ('AR', 'AR'),
-            ('CA', 'CA'),
-            ('CO', 'CO'),
-            ('CT', 'CT'),
-            ('DE', 'DE'),
-            ('DC', 'DC'),
-            ('FL', 'FL'),
-            ('GA', 'GA'),
-            ('HI', 'HI'),
-            ('ID', 'ID'),
-            ('IL', 'IL'),
-            ('IN', 'IN'),
-            ('IA', 'IA'),
-            ('KS', 'KS'),
-            ('KY', 'KY'),
-            ('LA', 'LA'),
-            ('ME', 'ME'),
-            ('MT', 'MT'),
-            ('NE', 'NE'),
-            ('NV', 'NV'),
-            ('NH', 'NH'),
-            ('NJ', 'NJ'),
-            ('NM', 'NM'),
-            ('NY', 'NY'),
-            ('NC', 'NC'),
-            ('ND', 'ND'),
-            ('OH', 'OH'),
-            ('OK', 'OK'),
-            ('OR', 'OR'),
-            ('MD', 'MD'),
-            ('MA', 'MA'),
-            ('MI', 'MI'),
-            ('MN', 'MN'),
-            ('MS', 'MS'),
-            ('MO', 'MO'),
-            ('PA', 'PA'),
-            ('RI', 'RI'),
-            ('SC', 'SC'),
-            ('SD', 'SD'),
-            ('TN', 'TN'),
-            ('TX', 'TX'),
-            ('UT', 'UT'),
-            ('VT', 'VT'),
-            ('VA', 'VA'),
-            ('WA', 'WA'),
-            ('WV', 'WV'),
-            ('WI', 'WI'),
-            ('WY', 'WY'),
-        ]
+        choices=STATE_CHOICES, widget=CachedSelect()
     )
     phone = StringField(
         # TODO implement validation logic for state
@@ -190,27 +182,7 @@ class ArtistForm(Form):
     genres = SelectMultipleField(
         # TODO implement enum restriction
         'genres', validators=[DataRequired()],
-        choices=[
-            ('Alternative', 'Alternative'),
-            ('Blues', 'Blues'),
-            ('Classical', 'Classical'),
-            ('Country', 'Country'),
-            ('Electronic', 'Electronic'),
-            ('Folk', 'Folk'),
-            ('Funk', 'Funk'),
-            ('Hip-Hop', 'Hip-Hop'),
-            ('Heavy Metal', 'Heavy Metal'),
-            ('Instrumental', 'Instrumental'),
-            ('Jazz', 'Jazz'),
-            ('Musical Theatre', 'Musical Theatre'),
-            ('Pop', 'Pop'),
-            ('Punk', 'Punk'),
-            ('R&B', 'R&B'),
-            ('Reggae', 'Reggae'),
-            ('Rock n Roll', 'Rock n Roll'),
-            ('Soul', 'Soul'),
-            ('Other', 'Other'),
-        ]
+        choices=GENRE_CHOICES, widget=CachedSelect(multiple=True)
     )
     facebook_link = StringField(
         # TODO implement enum restriction
@@ -0,0 +1,273 @@
+import io
+import os
+import socket
+import hashlib
+import tempfile
+import threading
+import ipaddress
+import http.client
+import urllib.request
+from urllib.parse import urlsplit
+from flask import Blueprint, current_app, request, abort, send_file
+from models import db, Artist, Venue
+from routing import read_replica
+
+# region Image cache
+# Thumbnails are files named by the digest of their source link, size and
+# format, so a changed image link gets new files and an old file never has
+# to be revalidated. Every hit touches the file and the least recently used
+# files are removed once the directory grows over IMAGE_CACHE_MAX_BYTES.
+
+class ImageCache:
+    """ Content addressed thumbnail files with least recently used eviction.
+
+    Args:
+       directory: cache directory, created when missing (string)
+       max_bytes: maximum total size of the cached files (int)
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, key)
+
+    def get(self, key):
+        try:
+            os.utime(self.path(key))
+        except FileNotFoundError:
+            return None
+        return self.path(key)
+
+    def set(self, key, data):
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(data)
+        os.replace(temporary, self.path(key))
+        self.evict()
+        return self.path(key)
+
+    def evict(self):
+        with self.lock:
+            files = []
+            for entry in os.scandir(self.directory):
+                if entry.is_file() and not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+            total = sum(size for mtime, size, path in files)
+            for mtime, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+# endregion
+
+# region Thumbnails
+
+IMAGE_FORMATS = {'webp': ('WEBP', 'image/webp'), 'jpeg': ('JPEG', 'image/jpeg')}
+
+
+def image_digest(link):
+    return hashlib.sha256(link.encode()).hexdigest()[:16]
+
+
+def public_address(host):
+    """ The function resolve a host and check every address of it is public.
+
+    Args:
+       host: host name or address (string)
+
+    Returns:
+       First address (string), raise ValueError for a private or unknown host
+    """
+    try:
+        addresses = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    except OSError as error:
+        raise ValueError('image host {} not found, {}'.format(host, error))
+    for family, type, proto, canonname, address in addresses:
+        if not ipaddress.ip_address(address[0]).is_global:
+            raise ValueError('image host {} is not public'.format(host))
+    return addresses[0][4][0]
+
+
+# The connections connect to the address that was checked, so a host that
+# resolves to another address on a second lookup is never reached.
+class PublicHTTPConnection(http.client.HTTPConnection):
+
+    def connect(self):
+        self.sock = socket.create_connection((public_address(self.host), self.port), self.timeout)
+
+
+class PublicHTTPSConnection(http.client.HTTPSConnection):
+
+    def connect(self):
+        sock = socket.create_connection((public_address(self.host), self.port), self.timeout)
+        self.sock = self._context.wrap_socket(sock, server_hostname=self.host)
+
+
+class PublicHTTPHandler(urllib.request.HTTPHandler):
+
+    def http_open(self, req):
+        return self.do_open(PublicHTTPConnection, req)
+
+
+class PublicHTTPSHandler(urllib.request.HTTPSHandler):
+
+    def https_open(self, req):
+        return self.do_open(PublicHTTPSConnection, req, context=self._context)
+
+
+class PublicRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """ Follow redirects to http(s) urls only. """
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        if urlsplit(newurl).scheme not in ('http', 'https'):
+            raise ValueError('unsupported image redirect {}'.format(newurl))
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+def image_opener():
+    # An empty ProxyHandler ignores HTTP(S)_PROXY, a proxy would resolve the host itself
+    return urllib.request.build_opener(urllib.request.ProxyHandler({}), PublicHTTPHandler,
+                                       PublicHTTPSHandler, PublicRedirectHandler)
+
+
+def read_source(link):
+    """ The function read the bytes of an image link, http(s) links are
+        fetched from public hosts only, file links and paths are read from
+        IMAGE_LOCAL_ROOT when it is set.
+
+    Args:
+       link: image link of a venue or artist (string)
+
+    Returns:
+       Image bytes, raise ValueError when the link can not be read
+    """
+    config = current_app.config
+    parts = urlsplit(link)
+    if parts.scheme in ('http', 'https'):
+        try:
+            with image_opener().open(link, timeout=config['IMAGE_FETCH_TIMEOUT']) as response:
+                data = response.read(config['IMAGE_MAX_SOURCE_BYTES'] + 1)
+        except OSError as error:
+            raise ValueError('image {} could not be fetched, {}'.format(link, error))
+    elif parts.scheme in ('', 'file') and config['IMAGE_LOCAL_ROOT']:
+        root = os.path.realpath(config['IMAGE_LOCAL_ROOT'])
+        path = os.path.realpath(os.path.join(root, parts.path.lstrip('/')))
+        if os.path.commonpath([root, path]) != root or not os.path.isfile(path):
+            raise ValueError('image {} not found'.format(link))
+        with open(path, 'rb') as file:
+            data = file.read(config['IMAGE_MAX_SOURCE_BYTES'] + 1)
+    else:
+        raise ValueError('unsupported image link {}'.format(link))
+    if len(data) > config['IMAGE_MAX_SOURCE_BYTES']:
+        raise ValueError('image {} is larger than {} bytes'.format(link, config['IMAGE_MAX_SOURCE_BYTES']))
+    return data
+
+
+def make_thumbnail(data, width, format):
+    """ The function resize an image to at most the given width keeping its
+        aspect ratio, Pillow is imported on the first call.
+
+    Args:
+       data: source image bytes
+       width: maximum width in pixels (int)
+       format: 'webp' or 'jpeg' (string)
+
+    Returns:
+       Thumbnail bytes, raise ValueError when the source is not an image
+    """
+    from PIL import Image, ImageOps
+    try:
+        image = Image.open(io.BytesIO(data))
+        image.draft('RGB', (width, width * 4))
+        image = ImageOps.exif_transpose(image).convert('RGB')
+    except (OSError, Image.DecompressionBombError) as error:
+        raise ValueError('invalid image, {}'.format(error))
+    image.thumbnail((width, width * 4))
+    output = io.BytesIO()
+    image.save(output, IMAGE_FORMATS[format][0], quality=current_app.config['IMAGE_QUALITY'])
+    return output.getvalue()
+
+
+def image_url(kind, id, link, size):
+    """ The function make the thumbnail url of a venue or artist image, the
+        url carries the digest of the link so it can be cached forever.
+
+    Args:
+       kind: 'venue' or 'artist' (string)
+       id: venue or artist id (int)
+       link: image link of the venue or artist (string)
+       size: name of a size of IMAGE_SIZES (string)
+
+    Returns:
+       Thumbnail url, or the empty link itself (string)
+    """
+    if not link:
+        return link
+    return '/img/{}/{}/{}?v={}'.format(kind, id, size, image_digest(link))
+
+# endregion
+
+# region Image views
+
+image_pages = Blueprint('images', __name__)
+
+IMAGE_MODELS = {'venue': Venue, 'artist': Artist}
+
+
+def init_images(app):
+    """ The function make the thumbnail cache of the app and add the
+        image_url template function.
+
+    Args:
+       app: Flask app with IMAGE_CACHE_DIR and IMAGE_CACHE_MAX_BYTES config
+    """
+    app.extensions['image_cache'] = ImageCache(app.config['IMAGE_CACHE_DIR'], app.config['IMAGE_CACHE_MAX_BYTES'])
+    app.jinja_env.globals['image_url'] = image_url
+
+
+@image_pages.route('/img/<kind>/<int:id>/<size>')
+@read_replica
+def image(kind, id, size):
+    """ The function serve a thumbnail of a venue or artist image, made from
+        the source link on the first request and then read from the disk cache.
+
+    Returns:
+       WebP or JPEG thumbnail depending on the Accept header
+    """
+    config = current_app.config
+    if kind not in IMAGE_MODELS or size not in config['IMAGE_SIZES']:
+        abort(404)
+    Model = IMAGE_MODELS[kind]
+    link = db.session.query(Model.image_link).filter(Model.id == id).scalar()
+    if not link:
+        abort(404)
+    # Browsers without WebP support still send image/*, so only a client
+    # naming image/webp gets it
+    format = 'webp' if any(value == 'image/webp' and quality for value, quality in request.accept_mimetypes) else 'jpeg'
+    digest = image_digest(link)
+    key = '{}-{}.{}'.format(digest, size, format)
+    cache = current_app.extensions['image_cache']
+    path = cache.get(key)
+    if path is None:
+        try:
+            path = cache.set(key, make_thumbnail(read_source(link), config['IMAGE_SIZES'][size], format))
+        except ValueError as error:
+            current_app.logger.warning('Thumbnail of %s %s failed: %s', kind, id, error)
+            abort(404)
+    immutable = request.args.get('v') == digest
+    response = send_file(path, mimetype=IMAGE_FORMATS[format][1], etag=key, conditional=True,
+                         max_age=31536000 if immutable else config['IMAGE_MAX_AGE'])
+    response.cache_control.immutable = immutable
+    response.vary.add('Accept')
+    return response
+
+# endregion
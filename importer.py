@@ -0,0 +1,259 @@
+import io
+import csv
+import json
+import time
+from datetime import datetime
+import dateutil.parser
+from models import db, Artist, Venue, Show, Genre, venue_genres, artist_genres, SHOW_MAX_DURATION
+from forms import ValidPhoneNumber
+from counters import count_new_show_rows
+from conflicts import show_end_time, find_conflicts
+
+# region Bulk import
+# Streams CSV or JSONL records into Venue, Artist or Shows in batches. Every
+# batch is validated with set lookups, inserted with COPY on Postgres or
+# executemany elsewhere and committed on its own.
+
+VENUE_COLUMNS = ['name', 'city', 'state', 'address', 'phone', 'image_link', 'facebook_link',
+                 'website', 'seeking_talent', 'seeking_description']
+ARTIST_COLUMNS = ['name', 'city', 'state', 'phone', 'image_link', 'facebook_link',
+                  'website', 'seeking_venue', 'seeking_description']
+SHOW_COLUMNS = ['venue_id', 'artist_id', 'start_time', 'end_time', 'is_past']
+BOOLEAN_COLUMNS = {'seeking_talent', 'seeking_venue'}
+
+
+class ImportReport:
+    """ Counts of an import run with the rejected records and their reasons. """
+
+    def __init__(self):
+        self.imported = 0
+        self.rejected = []
+        self.started = time.perf_counter()
+
+    @property
+    def seconds(self):
+        return time.perf_counter() - self.started
+
+    @property
+    def rows_per_second(self):
+        return self.imported / self.seconds if self.seconds else 0
+
+
+def read_records(path, rejected):
+    """ The function stream the records of a .csv (with header) or .jsonl file,
+        jsonl lines that are not a JSON object are rejected.
+
+    Args:
+       path: file path (string)
+       rejected: list the (line number, reason) of unreadable lines are added to
+
+    Returns:
+       Generator of line number and record (dict)
+    """
+    with open(path, newline='') as file:
+        if path.endswith('.jsonl'):
+            for line_number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as error:
+                    rejected.append((line_number, 'invalid JSON: {}'.format(error)))
+                    continue
+                if not isinstance(record, dict):
+                    rejected.append((line_number, 'invalid record: expected a JSON object'))
+                    continue
+                yield line_number, record
+        else:
+            reader = csv.DictReader(file)
+            for record in reader:
+                yield reader.line_num, record
+
+
+def batches(records, batch_size):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def parse_boolean(value):
+    if isinstance(value, bool) or value is None:
+        return value
+    return str(value).strip().lower() in ('1', 'true', 't', 'yes', 'y')
+
+
+def parse_genres(value):
+    if isinstance(value, list):
+        return [str(name).strip() for name in value if str(name).strip()]
+    return [name.strip() for name in str(value or '').split(',') if name.strip()]
+
+
+def reserve_ids(table, count):
+    """ The function reserve count new primary keys of the table so related
+        rows can be inserted in the same batch.
+
+    Args:
+       table: Venue or Artist table
+       count: number of ids (int)
+
+    Returns:
+       Ids (list)
+    """
+    connection = db.session.connection()
+    if connection.dialect.name == 'postgresql':
+        return [id for id, in connection.execute(db.text(
+            "SELECT nextval(pg_get_serial_sequence(:table, 'id')) FROM generate_series(1, :count)"),
+            {'table': '"{}"'.format(table.name), 'count': count})]
+    start = connection.execute(db.select(db.func.coalesce(db.func.max(table.c.id), 0))).scalar() + 1
+    return list(range(start, start + count))
+
+
+def insert_rows(table, columns, rows):
+    """ The function bulk insert rows, with COPY on Postgres and executemany
+        on other databases.
+
+    Args:
+       table: table to insert into
+       columns: column names (list)
+       rows: rows as dicts (list)
+    """
+    if not rows:
+        return
+    connection = db.session.connection()
+    if connection.dialect.name == 'postgresql':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([row[column] for column in columns])
+        buffer.seek(0)
+        cursor = connection.connection.cursor()
+        cursor.copy_expert('COPY "{}" ({}) FROM STDIN WITH (FORMAT csv)'.format(
+            table.name, ', '.join(columns)), buffer)
+    else:
+        connection.execute(table.insert(), rows)
+
+
+def validate_entity(record, columns):
+    row = {column: record.get(column) if record.get(column) != '' else None for column in columns}
+    for column in columns:
+        if column in BOOLEAN_COLUMNS:
+            row[column] = parse_boolean(row[column])
+        elif isinstance(row[column], (dict, list)):
+            raise ValueError('invalid ' + column)
+        elif row[column] is not None:
+            row[column] = str(row[column])
+    for column in ('name', 'city', 'state'):
+        if not row[column]:
+            raise ValueError('missing ' + column)
+    if not ValidPhoneNumber(row['phone'] or ''):
+        raise ValueError('incorrect phone number format xxx-xxx-xxxx')
+    return row
+
+
+def import_entities(Model, columns, association, fk, batch, report):
+    rows = []
+    genres = []
+    for line_number, record in batch:
+        try:
+            rows.append(validate_entity(record, columns))
+        except ValueError as error:
+            report.rejected.append((line_number, str(error)))
+            continue
+        genres.append(parse_genres(record.get('genres')))
+    if not rows:
+        return 0
+    all_genres = Genre.get_or_create_all(sorted({name for names in genres for name in names}))
+    db.session.flush()
+    genre_ids = {genre.name: genre.id for genre in all_genres}
+    for row, id in zip(rows, reserve_ids(Model.__table__, len(rows))):
+        row['id'] = id
+    insert_rows(Model.__table__, ['id'] + columns, rows)
+    insert_rows(association, [fk, 'genre_id'], [
+        {fk: row['id'], 'genre_id': genre_ids[name]} for row, names in zip(rows, genres) for name in set(names)])
+    return len(rows)
+
+
+def parse_time(value):
+    time = dateutil.parser.isoparse(str(value))
+    if time.tzinfo:
+        time = time.astimezone().replace(tzinfo=None)
+    return time
+
+
+def import_shows(batch, report):
+    now = datetime.now()
+    venue_ids = {str(record.get('venue_id')).strip() for line_number, record in batch}
+    artist_ids = {str(record.get('artist_id')).strip() for line_number, record in batch}
+    venue_ids = {str(id) for id, in db.session.query(Venue.id).filter(
+        Venue.id.in_([id for id in venue_ids if id.isdigit()]))}
+    artist_ids = {str(id) for id, in db.session.query(Artist.id).filter(
+        Artist.id.in_([id for id in artist_ids if id.isdigit()]))}
+    rows = []
+    line_numbers = []
+    for line_number, record in batch:
+        venue_id = str(record.get('venue_id')).strip()
+        artist_id = str(record.get('artist_id')).strip()
+        try:
+            if venue_id not in venue_ids:
+                raise ValueError('venue {} not found'.format(venue_id))
+            if artist_id not in artist_ids:
+                raise ValueError('artist {} not found'.format(artist_id))
+            start_time = parse_time(record.get('start_time'))
+            if record.get('end_time'):
+                end_time = parse_time(record['end_time'])
+                if not start_time < end_time <= start_time + SHOW_MAX_DURATION:
+                    raise ValueError('end_time must be after start_time and within {}'.format(SHOW_MAX_DURATION))
+            else:
+                end_time = show_end_time(start_time, record.get('duration'))
+        except ValueError as error:
+            report.rejected.append((line_number, str(error)))
+            continue
+        rows.append({'venue_id': int(venue_id), 'artist_id': int(artist_id),
+                     'start_time': start_time, 'end_time': end_time, 'is_past': start_time <= now})
+        line_numbers.append(line_number)
+    conflicts = find_conflicts(rows)
+    for position in sorted(conflicts):
+        report.rejected.append((line_numbers[position], 'venue {} is already booked at {}'.format(
+            rows[position]['venue_id'], rows[position]['start_time'])))
+    rows = [row for position, row in enumerate(rows) if position not in conflicts]
+    insert_rows(Show.__table__, SHOW_COLUMNS, rows)
+    count_new_show_rows(rows)
+    return len(rows)
+
+
+def import_file(kind, path, batch_size=1000):
+    """ The function import venues, artists or shows from a .csv or .jsonl file,
+        genres of venues and artists are given comma joined or as a json list.
+
+    Args:
+       kind: 'venues', 'artists' or 'shows' (string)
+       path: file path (string)
+       batch_size: number of records per transaction (int)
+
+    Returns:
+       ImportReport of imported count, rejected records and throughput
+    """
+    report = ImportReport()
+    for batch in batches(read_records(path, report.rejected), batch_size):
+        try:
+            rejected = len(report.rejected)
+            if kind == 'venues':
+                imported = import_entities(Venue, VENUE_COLUMNS, venue_genres, 'venue_id', batch, report)
+            elif kind == 'artists':
+                imported = import_entities(Artist, ARTIST_COLUMNS, artist_genres, 'artist_id', batch, report)
+            else:
+                imported = import_shows(batch, report)
+            db.session.commit()
+            report.imported += imported
+        except Exception as error:
+            db.session.rollback()
+            del report.rejected[rejected:]
+            report.rejected.extend((line_number, 'batch failed: {}'.format(error)) for line_number, record in batch)
+    return report
+
+# endregion
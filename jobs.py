@@ -0,0 +1,319 @@
+import json
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+from collections import namedtuple
+from flask import current_app
+from models import db, Show
+from cache import page_cache
+from metrics import Histogram, route_label, SECONDS_BUCKETS
+
+# region Job store
+# Jobs are rows of a SQLite table shared by every process of the host, so a
+# job enqueued by a request survives a restart and can be run by the threads
+# of any web process or by the run-jobs command. A job is claimed in a write
+# transaction, deleted when it succeeds and kept with its error when it runs
+# out of attempts.
+
+Job = namedtuple('Job', 'id name args attempts enqueued_at')
+
+
+class JobStore:
+    """ Durable job table in a SQLite file.
+
+    Args:
+       path: path of the SQLite file (string)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with self.transaction() as connection:
+            connection.execute('''CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                args TEXT NOT NULL,
+                state TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                run_at REAL NOT NULL,
+                enqueued_at REAL NOT NULL,
+                started_at REAL,
+                error TEXT)''')
+            connection.execute('CREATE INDEX IF NOT EXISTS ix_jobs_state_run_at ON jobs (state, run_at)')
+
+    @contextmanager
+    def transaction(self):
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield connection
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            connection.execute('COMMIT')
+        finally:
+            connection.close()
+
+    def put(self, name, args, run_at):
+        with self.transaction() as connection:
+            connection.execute('INSERT INTO jobs (name, args, run_at, enqueued_at) VALUES (?, ?, ?, ?)',
+                               (name, json.dumps(args), run_at, time.time()))
+
+    def claim(self, now, timeout):
+        """ The function take the next due job, jobs left running longer than
+            timeout by a dead worker are taken again.
+
+        Args:
+           now: current time (float)
+           timeout: seconds after which a running job is given up (float)
+
+        Returns:
+           Job or None when no job is due
+        """
+        with self.transaction() as connection:
+            row = connection.execute(
+                "SELECT id, name, args, attempts, enqueued_at FROM jobs WHERE (state = 'queued' AND run_at <= ?) "
+                "OR (state = 'running' AND started_at < ?) ORDER BY run_at, id LIMIT 1", (now, now - timeout)).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE jobs SET state = 'running', started_at = ?, attempts = attempts + 1 WHERE id = ?",
+                               (now, row[0]))
+        return Job(row[0], row[1], json.loads(row[2]), row[3] + 1, row[4])
+
+    def finish(self, id):
+        with self.transaction() as connection:
+            connection.execute('DELETE FROM jobs WHERE id = ?', (id,))
+
+    def retry(self, id, run_at, error):
+        with self.transaction() as connection:
+            connection.execute("UPDATE jobs SET state = 'queued', run_at = ?, error = ? WHERE id = ?", (run_at, error, id))
+
+    def fail(self, id, error):
+        with self.transaction() as connection:
+            connection.execute("UPDATE jobs SET state = 'failed', error = ? WHERE id = ?", (error, id))
+
+    def depth(self):
+        with self.transaction() as connection:
+            return dict(connection.execute('SELECT state, count(*) FROM jobs GROUP BY state').fetchall())
+
+# endregion
+
+# region Job runner
+
+TASKS = {}
+
+
+class JobMetrics:
+    """ Per task histograms of queue wait and run time with a counter of
+        finished, retried and failed runs.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.results = {}
+        self.histograms = [
+            Histogram('fyyur_job_wait_seconds', 'Time from enqueue to the start of the job run.', SECONDS_BUCKETS, 'task'),
+            Histogram('fyyur_job_duration_seconds', 'Job run time.', SECONDS_BUCKETS, 'task'),
+        ]
+
+    def observe(self, task, wait, duration, result):
+        with self.lock:
+            for histogram, value in zip(self.histograms, (wait, duration)):
+                histogram.observe(task, value)
+            self.results[(task, result)] = self.results.get((task, result), 0) + 1
+
+    def render(self, depth):
+        with self.lock:
+            lines = ['# HELP fyyur_jobs Jobs in the job table by state.', '# TYPE fyyur_jobs gauge']
+            for state in ('queued', 'running', 'failed'):
+                lines.append('fyyur_jobs{{{}}} {}'.format(route_label(state, 'state'), depth.get(state, 0)))
+            for histogram in self.histograms:
+                lines.extend(histogram.render())
+            lines.append('# HELP fyyur_job_runs_total Job runs of this process by result.')
+            lines.append('# TYPE fyyur_job_runs_total counter')
+            for (task, result), count in sorted(self.results.items()):
+                lines.append('fyyur_job_runs_total{{{},{}}} {}'.format(
+                    route_label(task, 'task'), route_label(result, 'result'), count))
+            return '\n'.join(lines) + '\n'
+
+
+class JobRunner:
+    """ Worker threads of one app running jobs of the job table, a failed job
+        is run again after JOBS_RETRY_BACKOFF seconds doubled at each attempt.
+
+    Args:
+       app: Flask app with JOBS_* config
+       store: JobStore of the app
+    """
+
+    def __init__(self, app, store):
+        self.app = app
+        self.store = store
+        self.metrics = JobMetrics()
+        self.wakeup = threading.Event()
+        self.stopping = threading.Event()
+        self.threads = []
+        self.lock = threading.Lock()
+
+    def start(self, threads):
+        """ The function start the worker threads, or the ones of them that are
+            no longer alive, they stop with the process.
+
+        Args:
+           threads: number of worker threads (int)
+        """
+        with self.lock:
+            for number in range(threads):
+                if number < len(self.threads) and self.threads[number].is_alive():
+                    continue
+                thread = threading.Thread(target=self.work, name='fyyur-jobs-{}'.format(number), daemon=True)
+                if number < len(self.threads):
+                    self.threads[number] = thread
+                else:
+                    self.threads.append(thread)
+                thread.start()
+
+    def run(self, threads, burst=False):
+        """ The function run worker threads in the foreground until interrupted,
+            or until no job is due when burst.
+
+        Args:
+           threads: number of worker threads (int)
+           burst: stop once the job table has no due job (bool)
+        """
+        workers = [threading.Thread(target=self.work, args=(burst,), daemon=True) for number in range(threads)]
+        for worker in workers:
+            worker.start()
+        try:
+            while any(worker.is_alive() for worker in workers):
+                for worker in workers:
+                    worker.join(1)
+        except KeyboardInterrupt:
+            self.stopping.set()
+            for worker in workers:
+                worker.join()
+
+    def work(self, burst=False):
+        while not self.stopping.is_set():
+            try:
+                if self.run_next():
+                    continue
+                if burst:
+                    return
+            except Exception:
+                # A job table error (e.g. locked past the timeout) must not end
+                # the thread, a job it left running is claimed again after
+                # JOBS_TIMEOUT
+                self.app.logger.exception('Job table error, retrying')
+            self.wakeup.wait(self.app.config['JOBS_POLL_INTERVAL'])
+            self.wakeup.clear()
+
+    def run_next(self):
+        config = self.app.config
+        job = self.store.claim(time.time(), config['JOBS_TIMEOUT'])
+        if job is None:
+            return False
+        started = time.time()
+        try:
+            with self.app.app_context():
+                TASKS[job.name](*job.args)
+        except Exception as error:
+            self.app.logger.exception('Job %s %s failed (attempt %d)', job.name, job.id, job.attempts)
+            if job.attempts < config['JOBS_MAX_ATTEMPTS']:
+                self.store.retry(job.id, time.time() + config['JOBS_RETRY_BACKOFF'] * 2 ** (job.attempts - 1), repr(error))
+                result = 'retried'
+            else:
+                self.store.fail(job.id, repr(error))
+                result = 'failed'
+        else:
+            self.store.finish(job.id)
+            result = 'done'
+        self.metrics.observe(job.name, started - job.enqueued_at, time.time() - started, result)
+        return True
+
+    def render_metrics(self):
+        return self.metrics.render(self.store.depth())
+
+
+class JobQueue:
+    """ Background jobs for work done after a request committed, the runner of
+        each app is made by init_app and its threads start on the first
+        enqueue when JOBS_WORKERS is not 0.
+    """
+
+    def init_app(self, app):
+        """ The function make the job table and runner of the app.
+
+        Args:
+           app: Flask app with JOBS_DATABASE, JOBS_WORKERS, JOBS_MAX_ATTEMPTS,
+                JOBS_RETRY_BACKOFF, JOBS_TIMEOUT and JOBS_POLL_INTERVAL config
+        """
+        app.extensions['job_queue'] = JobRunner(app, JobStore(app.config['JOBS_DATABASE']))
+
+    @property
+    def runner(self):
+        return current_app.extensions['job_queue']
+
+    def task(self, function):
+        """ The function register a function as a task jobs can run by its name. """
+        TASKS[function.__name__] = function
+        return function
+
+    def enqueue(self, name, *args, delay=0):
+        """ The function add a job to the job table, call it after the commit
+            of the data the job reads. The request already succeeded then, so
+            a job table error is logged and the job dropped.
+
+        Args:
+           name: name of the task (string)
+           args: JSON serializable task arguments
+           delay: seconds before the job is due (float)
+
+        Returns:
+           True when the job was added (bool)
+        """
+        runner = self.runner
+        try:
+            runner.store.put(name, args, time.time() + delay)
+        except (sqlite3.Error, OSError):
+            current_app.logger.exception('Job %s %r could not be enqueued', name, args)
+            return False
+        if current_app.config['JOBS_WORKERS']:
+            runner.start(current_app.config['JOBS_WORKERS'])
+            runner.wakeup.set()
+        return True
+
+
+jobs = JobQueue()
+
+# endregion
+
+# region Tasks
+
+@jobs.task
+def invalidate_pages(kind, ids):
+    """ The function remove cached pages of the given entities.
+
+    Args:
+       kind: 'venue' or 'artist' (string)
+       ids: entity ids (list)
+    """
+    page_cache.invalidate(kind, *ids)
+
+
+@jobs.task
+def invalidate_related_pages(kind, id):
+    """ The function remove the cached pages of the venues or artists sharing
+        a show with the given artist or venue.
+
+    Args:
+       kind: 'venue' or 'artist' of the changed entity (string)
+       id: id of the changed entity (int)
+    """
+    fk, other_fk, other_kind = ((Show.venue_id, Show.artist_id, 'artist') if kind == 'venue'
+                                else (Show.artist_id, Show.venue_id, 'venue'))
+    page_cache.invalidate(other_kind, *[other_id for other_id, in db.session.query(other_fk).filter(fk == id).distinct()])
+
+# endregion
@@ -0,0 +1,86 @@
+import os
+import secrets
+from flask.sessions import SecureCookieSessionInterface
+from itsdangerous import URLSafeTimedSerializer
+
+# region Secret keys
+# Every worker and node must sign session cookies and CSRF tokens with the
+# same key. The key comes from the environment or a key file, old keys stay
+# valid for reading until every client got a cookie signed with the new one.
+
+def read_keys(value):
+    return [key.strip() for key in value.replace(',', '\n').splitlines() if key.strip()]
+
+
+def load_secret_key(key_file):
+    """ The function load the secret key from the SECRET_KEY environment
+        variable, else from the key file, which is created with a random key
+        when missing so all workers of the host share it.
+
+    Args:
+       key_file: path of the key file (string)
+
+    Returns:
+       Secret key (string)
+    """
+    if os.environ.get('SECRET_KEY'):
+        return os.environ['SECRET_KEY']
+    try:
+        descriptor = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        with open(key_file) as file:
+            return file.read().strip()
+    key = secrets.token_hex(32)
+    with os.fdopen(descriptor, 'w') as file:
+        file.write(key + '\n')
+    return key
+
+
+def load_fallback_keys(fallback_file):
+    """ The function load the old secret keys from the comma separated
+        SECRET_KEY_FALLBACKS environment variable, else from the fallback
+        file with one key per line.
+
+    Args:
+       fallback_file: path of the fallback keys file (string)
+
+    Returns:
+       Old secret keys, oldest first (list)
+    """
+    if os.environ.get('SECRET_KEY_FALLBACKS'):
+        return read_keys(os.environ['SECRET_KEY_FALLBACKS'])
+    if os.path.exists(fallback_file):
+        with open(fallback_file) as file:
+            return read_keys(file.read())
+    return []
+
+
+class RotatingSessionInterface(SecureCookieSessionInterface):
+    """ Cookie session signed with SECRET_KEY and still accepting cookies
+        signed with any of SECRET_KEY_FALLBACKS.
+    """
+
+    def get_signing_serializer(self, app):
+        if not app.secret_key:
+            return None
+        return URLSafeTimedSerializer(
+            app.config['SECRET_KEY_FALLBACKS'] + [app.secret_key],
+            salt=self.salt,
+            serializer=self.serializer,
+            signer_kwargs=dict(key_derivation=self.key_derivation, digest_method=self.digest_method),
+        )
+
+
+def init_keys(app):
+    """ The function make the session cookie and the CSRF tokens of the app
+        accept the old secret keys, new ones are signed with SECRET_KEY.
+
+    Args:
+       app: Flask app with SECRET_KEY and SECRET_KEY_FALLBACKS config
+    """
+    app.config.setdefault('SECRET_KEY_FALLBACKS', [])
+    app.session_interface = RotatingSessionInterface()
+    if app.config['SECRET_KEY_FALLBACKS'] and not app.config.get('WTF_CSRF_SECRET_KEY'):
+        app.config['WTF_CSRF_SECRET_KEY'] = app.config['SECRET_KEY_FALLBACKS'] + [app.config['SECRET_KEY']]
+
+# endregion
@@ -0,0 +1,118 @@
+import copy
+import json
+import time
+import uuid
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from flask import g, request, has_request_context
+
+# region Logging
+# Request threads only put records on a bounded queue, a listener thread
+# writes them as JSON lines to a rotating file. When the queue is full new
+# records are dropped and counted instead of blocking the request.
+
+class JsonFormatter(logging.Formatter):
+    """ Format log records as one JSON object per line. """
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "source": '{}:{}'.format(record.pathname, record.lineno),
+        }
+        for key in ('request_id', 'method', 'route', 'status', 'latency_ms'):
+            if getattr(record, key, None) is not None:
+                entry[key] = getattr(record, key)
+        # exc_text is the traceback cached by the first formatter of the
+        # record, or set by DroppingQueueHandler.prepare in the logging thread
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry)
+
+
+class RequestContextFilter(logging.Filter):
+    """ Add the request id, method and route to records logged while handling
+        a request, runs in the request thread before the record is queued.
+    """
+
+    def filter(self, record):
+        if has_request_context():
+            record.request_id = getattr(g, 'request_id', None)
+            record.method = request.method
+            record.route = request.url_rule.rule if request.url_rule else request.path
+        return True
+
+
+class DroppingQueueHandler(QueueHandler):
+    """ Queue handler that never blocks, records that do not fit in the queue
+        are dropped and reported by a warning once the queue has room again.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # The stdlib prepare appends the traceback to the message, keep it in
+        # exc_text for the "exception" field instead. The traceback objects
+        # are dropped as they can not be pickled and hold frames alive.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = (self.formatter or logging.Formatter()).formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            if self.dropped:
+                self.queue.put_nowait(self.prepare(logging.makeLogRecord({
+                    "name": __name__, "levelno": logging.WARNING, "levelname": "WARNING",
+                    "msg": '{} log records dropped, log queue full'.format(self.dropped)})))
+                self.dropped = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def init_logging(app):
+    """ The function route the app logger through a bounded queue to a rotating
+        JSON log file and log every request with its id, route and latency.
+
+    Args:
+       app: Flask app with LOG_FILE, LOG_MAX_BYTES, LOG_BACKUP_COUNT and LOG_QUEUE_SIZE config
+    """
+    file_handler = RotatingFileHandler(app.config['LOG_FILE'], maxBytes=app.config['LOG_MAX_BYTES'],
+                                       backupCount=app.config['LOG_BACKUP_COUNT'])
+    file_handler.setFormatter(JsonFormatter())
+    log_queue = queue.Queue(maxsize=app.config['LOG_QUEUE_SIZE'])
+    queue_handler = DroppingQueueHandler(log_queue)
+    queue_handler.addFilter(RequestContextFilter())
+    queue_handler.setLevel(logging.INFO)
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    app.logger.setLevel(logging.INFO)
+    app.logger.addHandler(queue_handler)
+
+    @app.before_request
+    def start_request_log():
+        g.request_id = request.headers.get('X-Request-ID') or uuid.uuid4().hex
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def log_request(response):
+        latency_ms = round((time.perf_counter() - g.get('request_started', time.perf_counter())) * 1000, 2)
+        app.logger.info('%s %s %s', request.method, request.path, response.status_code,
+                        extra={"status": response.status_code, "latency_ms": latency_ms})
+        response.headers['X-Request-ID'] = g.get('request_id', '')
+        return response
+
+# endregion
@@ -0,0 +1,145 @@
+import time
+import threading
+from flask import g, request, template_rendered, before_render_template, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# region Request metrics
+# Every request records its number of SQL statements, database time, template
+# render time and wall time. They are sent back in a Server-Timing header and
+# aggregated per route into histograms served in Prometheus text format.
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+
+class Histogram:
+    """ Cumulative histogram per route, or per value of another label, in the
+        Prometheus exposition format.
+    """
+
+    def __init__(self, name, help, buckets, label='route'):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        self.label = label
+        self.series = {}
+
+    def observe(self, route, value):
+        counts, total, count = self.series.get(route, ([0] * len(self.buckets), 0, 0))
+        counts = [bucket + (value <= bound) for bucket, bound in zip(counts, self.buckets)]
+        self.series[route] = (counts, total + value, count + 1)
+
+    def render(self):
+        lines = ['# HELP {} {}'.format(self.name, self.help), '# TYPE {} histogram'.format(self.name)]
+        for route, (counts, total, count) in sorted(self.series.items()):
+            label = route_label(route, self.label)
+            for bound, bucket in zip(self.buckets, counts):
+                lines.append('{}_bucket{{{},le="{}"}} {}'.format(self.name, label, bound, bucket))
+            lines.append('{}_bucket{{{},le="+Inf"}} {}'.format(self.name, label, count))
+            lines.append('{}_sum{{{}}} {}'.format(self.name, label, round(total, 6)))
+            lines.append('{}_count{{{}}} {}'.format(self.name, label, count))
+        return lines
+
+
+def route_label(route, name='route'):
+    return '{}="{}"'.format(name, route.replace('\\', '\\\\').replace('"', '\\"'))
+
+
+class RequestMetrics:
+    """ Per route histograms of request, database and template time and SQL
+        statement count, with a counter of requests over the query limit.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.over_query_limit = {}
+        self.histograms = [
+            Histogram('fyyur_request_duration_seconds', 'Request wall time.', SECONDS_BUCKETS),
+            Histogram('fyyur_db_duration_seconds', 'Time spent executing SQL per request.', SECONDS_BUCKETS),
+            Histogram('fyyur_template_duration_seconds', 'Time spent rendering templates per request.', SECONDS_BUCKETS),
+            Histogram('fyyur_db_queries', 'SQL statements executed per request.', QUERY_BUCKETS),
+        ]
+
+    def observe(self, route, total, db_time, template_time, queries, over_limit):
+        with self.lock:
+            for histogram, value in zip(self.histograms, (total, db_time, template_time, queries)):
+                histogram.observe(route, value)
+            if over_limit:
+                self.over_query_limit[route] = self.over_query_limit.get(route, 0) + 1
+
+    def render(self):
+        with self.lock:
+            lines = []
+            for histogram in self.histograms:
+                lines.extend(histogram.render())
+            lines.append('# HELP fyyur_requests_over_query_limit_total Requests that executed more than MAX_QUERIES_PER_REQUEST statements.')
+            lines.append('# TYPE fyyur_requests_over_query_limit_total counter')
+            for route, count in sorted(self.over_query_limit.items()):
+                lines.append('fyyur_requests_over_query_limit_total{{{}}} {}'.format(route_label(route), count))
+            return '\n'.join(lines) + '\n'
+
+
+# The start time is kept on the execution context of the statement, so it is
+# dropped with it when the statement fails and after_cursor_execute never runs.
+# Statements run without a context (dialect internals) are not counted.
+@event.listens_for(Engine, 'before_cursor_execute')
+def start_query(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context.query_started = time.perf_counter()
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def end_query(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, 'query_started', None)
+    if started is not None and has_request_context() and 'metrics_started' in g:
+        g.sql_count += 1
+        g.sql_time += time.perf_counter() - started
+
+
+def init_metrics(app):
+    """ The function instrument template rendering and requests of the app,
+        SQL execution of every engine is timed once for all apps.
+
+    Args:
+       app: Flask app with MAX_QUERIES_PER_REQUEST config
+
+    Returns:
+       RequestMetrics registry of the app
+    """
+    registry = app.extensions['request_metrics'] = RequestMetrics()
+
+    @before_render_template.connect_via(app)
+    def start_render(sender, template, context, **extra):
+        g.render_started = time.perf_counter()
+
+    @template_rendered.connect_via(app)
+    def end_render(sender, template, context, **extra):
+        if 'render_started' in g and 'metrics_started' in g:
+            g.template_time += time.perf_counter() - g.pop('render_started')
+
+    @app.before_request
+    def start_request_metrics():
+        g.metrics_started = time.perf_counter()
+        g.sql_count = 0
+        g.sql_time = 0
+        g.template_time = 0
+
+    @app.after_request
+    def record_request_metrics(response):
+        if 'metrics_started' not in g:
+            return response
+        total = time.perf_counter() - g.metrics_started
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        over_limit = g.sql_count > app.config['MAX_QUERIES_PER_REQUEST']
+        if over_limit:
+            app.logger.warning('%s executed %d SQL statements (limit %d)', route, g.sql_count,
+                               app.config['MAX_QUERIES_PER_REQUEST'])
+        registry.observe(route, total, g.sql_time, g.template_time, g.sql_count, over_limit)
+        response.headers['Server-Timing'] = 'db;dur={:.2f};desc="{} queries", tpl;dur={:.2f}, total;dur={:.2f}'.format(
+            g.sql_time * 1000, g.sql_count, g.template_time * 1000, total * 1000)
+        return response
+
+    return registry
+
+# endregion
@@ -0,0 +1,30 @@
+"""add full text and trigram search indexes on Venue and Artist names
+
+Revision ID: 5b7e2d9c4a18
+Revises: 3c1f8a2b7d4e
+Create Date: 2026-10-18 11:04:27.541093
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b7e2d9c4a18'
+down_revision = '3c1f8a2b7d4e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table in ('Venue', 'Artist'):
+        op.execute('CREATE INDEX "ix_{0}_name_tsv" ON "{0}" '
+                   "USING gin (to_tsvector('simple', coalesce(name, '')))".format(table))
+        op.execute('CREATE INDEX "ix_{0}_name_trgm" ON "{0}" USING gin (name gin_trgm_ops)'.format(table))
+
+
+def downgrade():
+    for table in ('Artist', 'Venue'):
+        op.drop_index('ix_{}_name_trgm'.format(table), table_name=table)
+        op.drop_index('ix_{}_name_tsv'.format(table), table_name=table)
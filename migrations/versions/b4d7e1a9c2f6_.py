@@ -0,0 +1,25 @@
+"""add Venue (state, city, name, id) index for the venues page
+
+Revision ID: b4d7e1a9c2f6
+Revises: f5a9c3e2b7d4
+Create Date: 2026-10-18 18:12:36.804417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4d7e1a9c2f6'
+down_revision = 'f5a9c3e2b7d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_Venue_state_city_name_id', 'Venue', ['state', 'city', 'name', 'id'], unique=False,
+                    postgresql_include=['upcoming_shows_count'])
+
+
+def downgrade():
+    op.drop_index('ix_Venue_state_city_name_id', table_name='Venue')
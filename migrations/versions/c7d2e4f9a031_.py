@@ -0,0 +1,36 @@
+"""add Shows.end_time and refuse overlapping shows at a venue
+
+Revision ID: c7d2e4f9a031
+Revises: a61c0e7b5f24
+Create Date: 2026-10-18 15:02:47.318264
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d2e4f9a031'
+down_revision = 'a61c0e7b5f24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('Shows', sa.Column('end_time', sa.DateTime(), nullable=True))
+    op.execute('''UPDATE "Shows" SET end_time = start_time + interval '2 hours\'''')
+    op.alter_column('Shows', 'end_time', nullable=False)
+    overlaps = op.get_bind().execute(sa.text(
+        'SELECT a.id, b.id, a.venue_id FROM "Shows" a JOIN "Shows" b ON a.venue_id = b.venue_id AND a.id < b.id '
+        'AND a.start_time < b.end_time AND b.start_time < a.end_time ORDER BY a.id LIMIT 20')).fetchall()
+    if overlaps:
+        raise RuntimeError('Shows overlap at the same venue, reschedule or delete them before upgrading: ' +
+                           ', '.join('shows {} and {} at venue {}'.format(*overlap) for overlap in overlaps))
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    op.execute('ALTER TABLE "Shows" ADD CONSTRAINT "ex_Shows_venue_id_during" '
+               'EXCLUDE USING gist (venue_id WITH =, tsrange(start_time, end_time) WITH &&)')
+
+
+def downgrade():
+    op.drop_constraint('ex_Shows_venue_id_during', 'Shows')
+    op.drop_column('Shows', 'end_time')
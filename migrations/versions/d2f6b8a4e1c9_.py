@@ -0,0 +1,31 @@
+"""make the Venue and Artist sort columns NOT NULL for keyset pagination
+
+Revision ID: d2f6b8a4e1c9
+Revises: b4d7e1a9c2f6
+Create Date: 2026-10-18 21:40:12.503318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2f6b8a4e1c9'
+down_revision = 'b4d7e1a9c2f6'
+branch_labels = None
+depends_on = None
+
+# A NULL in a row comparison of the page cursor drops the row from every page
+SORT_COLUMNS = [('Venue', 'name', sa.String()), ('Venue', 'city', sa.String(120)),
+                ('Venue', 'state', sa.String(120)), ('Artist', 'name', sa.String())]
+
+
+def upgrade():
+    for table, column, type in SORT_COLUMNS:
+        op.execute('''UPDATE "{0}" SET {1} = '' WHERE {1} IS NULL'''.format(table, column))
+        op.alter_column(table, column, existing_type=type, nullable=False)
+
+
+def downgrade():
+    for table, column, type in SORT_COLUMNS:
+        op.alter_column(table, column, existing_type=type, nullable=True)
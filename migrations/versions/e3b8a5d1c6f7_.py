@@ -0,0 +1,28 @@
+"""delete shows with their venue or artist by ON DELETE CASCADE
+
+Revision ID: e3b8a5d1c6f7
+Revises: c7d2e4f9a031
+Create Date: 2026-10-18 15:48:12.905316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3b8a5d1c6f7'
+down_revision = 'c7d2e4f9a031'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for table, column in (('Venue', 'venue_id'), ('Artist', 'artist_id')):
+        op.drop_constraint('Shows_{}_fkey'.format(column), 'Shows', type_='foreignkey')
+        op.create_foreign_key('Shows_{}_fkey'.format(column), 'Shows', table, [column], ['id'], ondelete='CASCADE')
+
+
+def downgrade():
+    for table, column in (('Venue', 'venue_id'), ('Artist', 'artist_id')):
+        op.drop_constraint('Shows_{}_fkey'.format(column), 'Shows', type_='foreignkey')
+        op.create_foreign_key('Shows_{}_fkey'.format(column), 'Shows', table, [column], ['id'])
@@ -0,0 +1,37 @@
+"""add ShowsArchive table for archived past shows
+
+Revision ID: f5a9c3e2b7d4
+Revises: e3b8a5d1c6f7
+Create Date: 2026-10-18 17:41:09.527310
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5a9c3e2b7d4'
+down_revision = 'e3b8a5d1c6f7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ShowsArchive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('venue_id', sa.Integer(), nullable=True),
+    sa.Column('artist_id', sa.Integer(), nullable=True),
+    sa.Column('start_time', sa.DateTime(), nullable=True),
+    sa.Column('end_time', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['artist_id'], ['Artist.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['venue_id'], ['Venue.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_ShowsArchive_venue_id_start_time', 'ShowsArchive', ['venue_id', 'start_time'], unique=False)
+    op.create_index('ix_ShowsArchive_artist_id_start_time', 'ShowsArchive', ['artist_id', 'start_time'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_ShowsArchive_artist_id_start_time', table_name='ShowsArchive')
+    op.drop_index('ix_ShowsArchive_venue_id_start_time', table_name='ShowsArchive')
+    op.drop_table('ShowsArchive')
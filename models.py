@@ -1,44 +1,138 @@
 from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
+from routing import RoutingSQLAlchemy
 from flask_migrate import Migrate
+from sqlalchemy import event, DDL
+from sqlalchemy.engine import Engine
 import datetime
 
-db = SQLAlchemy()
+db = RoutingSQLAlchemy()
+
+
+@event.listens_for(Engine, 'connect')
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # SQLite only enforces foreign keys, and so ON DELETE CASCADE, when asked on each connection
+    if type(dbapi_connection).__module__.startswith('sqlite3'):
+        dbapi_connection.execute('PRAGMA foreign_keys = ON')
 
 # region Models
 
 # region Shows table
+# Shows without an end time last SHOW_DEFAULT_DURATION, no show may last longer
+# than SHOW_MAX_DURATION so overlap lookups stay a bounded index range scan.
+SHOW_DEFAULT_DURATION = datetime.timedelta(hours=2)
+SHOW_MAX_DURATION = datetime.timedelta(hours=12)
+
+
+def default_end_time(context):
+    return context.get_current_parameters()['start_time'] + SHOW_DEFAULT_DURATION
+
+
 class Show(db.Model):
     __tablename__ = 'Shows'
+    __table_args__ = (
+        db.Index('ix_Shows_venue_id_start_time', 'venue_id', 'start_time'),
+        db.Index('ix_Shows_artist_id_start_time', 'artist_id', 'start_time'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     venue_id = db.Column(db.Integer, db.ForeignKey(
-        'Venue.id'))
+        'Venue.id', ondelete='CASCADE'))
     venue = db.relationship(
-        'Venue', backref=db.backref('Shows', cascade='all, delete'))
+        'Venue', backref=db.backref('Shows', cascade='all, delete', passive_deletes=True))
     artist_id = db.Column(db.Integer, db.ForeignKey(
-        'Artist.id'))
+        'Artist.id', ondelete='CASCADE'))
     artist = db.relationship(
-        'Artist', backref=db.backref('Shows', cascade='all, delete'))
+        'Artist', backref=db.backref('Shows', cascade='all, delete', passive_deletes=True))
+    start_time = db.Column(db.DateTime())
+    end_time = db.Column(db.DateTime(), nullable=False, default=default_end_time)
+    is_past = db.Column(db.Boolean(), nullable=False, default=False, server_default=db.false())
+
+# Postgres refuses overlapping shows at a venue (also created by migration c7d2e4f9a031)
+for statement in (
+        'CREATE EXTENSION IF NOT EXISTS btree_gist',
+        'ALTER TABLE "Shows" ADD CONSTRAINT "ex_Shows_venue_id_during" '
+        'EXCLUDE USING gist (venue_id WITH =, tsrange(start_time, end_time) WITH &&)'):
+    event.listen(Show.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
+# endregion
+
+# region Shows archive table
+# Past shows older than SHOW_ARCHIVE_AFTER_DAYS, moved out of Shows by the
+# archive-shows command with their ids kept.
+class ShowArchive(db.Model):
+    __tablename__ = 'ShowsArchive'
+    __table_args__ = (
+        db.Index('ix_ShowsArchive_venue_id_start_time', 'venue_id', 'start_time'),
+        db.Index('ix_ShowsArchive_artist_id_start_time', 'artist_id', 'start_time'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    venue_id = db.Column(db.Integer, db.ForeignKey('Venue.id', ondelete='CASCADE'))
+    artist_id = db.Column(db.Integer, db.ForeignKey('Artist.id', ondelete='CASCADE'))
     start_time = db.Column(db.DateTime())
+    end_time = db.Column(db.DateTime(), nullable=False)
+# endregion
+
+# region Genre table
+class Genre(db.Model):
+    __tablename__ = 'Genre'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(120), nullable=False, unique=True)
+
+    @classmethod
+    def get_or_create_all(cls, names):
+        """ The function return the genres with the given names, adding the
+            ones that do not exist yet to the session.
+
+        Args:
+           names: genre names (list)
+
+        Returns:
+           Genres in the order of names (list)
+        """
+        genres = {genre.name: genre for genre in cls.query.filter(cls.name.in_(names))}
+        for name in names:
+            if name not in genres:
+                genres[name] = cls(name=name)
+                db.session.add(genres[name])
+        return [genres[name] for name in names]
+
+
+venue_genres = db.Table('venue_genres',
+    db.Column('venue_id', db.Integer, db.ForeignKey('Venue.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('genre_id', db.Integer, db.ForeignKey('Genre.id'), primary_key=True),
+    db.Index('ix_venue_genres_genre_id_venue_id', 'genre_id', 'venue_id'))
+
+artist_genres = db.Table('artist_genres',
+    db.Column('artist_id', db.Integer, db.ForeignKey('Artist.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('genre_id', db.Integer, db.ForeignKey('Genre.id'), primary_key=True),
+    db.Index('ix_artist_genres_genre_id_artist_id', 'genre_id', 'artist_id'))
 # endregion
 
 # region Venue table
+# The venues page reads one (state, city, name, id) range of this index, the
+# upcoming counter is included so Postgres answers it from the index alone.
 class Venue(db.Model):
     __tablename__ = 'Venue'
+    __table_args__ = (
+        db.Index('ix_Venue_state_city_name_id', 'state', 'city', 'name', 'id',
+                 postgresql_include=['upcoming_shows_count']),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String)
-    city = db.Column(db.String(120))
-    state = db.Column(db.String(120))
+    name = db.Column(db.String, nullable=False)
+    city = db.Column(db.String(120), nullable=False)
+    state = db.Column(db.String(120), nullable=False)
     address = db.Column(db.String(120))
     phone = db.Column(db.String(120))
     image_link = db.Column(db.String(500))
     facebook_link = db.Column(db.String(120))
     seeking_talent = db.Column(db.Boolean())
     seeking_description = db.Column(db.String(500))
-    genres = db.Column(db.String(120))
+    genres = db.relationship('Genre', secondary=venue_genres, order_by=Genre.name)
     website = db.Column(db.String(120))
+    upcoming_shows_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    past_shows_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     artist = db.relationship('Artist', secondary="Shows",
                              backref=db.backref('Venue', lazy=True))
 # endregion
@@ -48,18 +142,46 @@ class Artist(db.Model):
     __tablename__ = 'Artist'
 
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String)
+    name = db.Column(db.String, nullable=False)
     city = db.Column(db.String(120))
     state = db.Column(db.String(120))
     phone = db.Column(db.String(120))
-    genres = db.Column(db.String(120))
+    genres = db.relationship('Genre', secondary=artist_genres, order_by=Genre.name)
     image_link = db.Column(db.String(500))
     facebook_link = db.Column(db.String(120))
     seeking_venue = db.Column(db.Boolean())
     seeking_description = db.Column(db.String(500))
     website = db.Column(db.String(120))
+    upcoming_shows_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    past_shows_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     venue = db.relationship('Venue', secondary="Shows",
                             backref=db.backref('Artist', lazy=True))
 # endregion
 
-# endregion
\ No newline at end of file
+# region Search indexes
+# Postgres: tsvector and pg_trgm GIN indexes on name (also created by migration 5b7e2d9c4a18).
+# SQLite: FTS5 external content tables kept in sync with name by triggers.
+def search_index_ddl(table, fts):
+    for statement in (
+            'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+            'CREATE INDEX "ix_{table}_name_tsv" ON "{table}" '
+            "USING gin (to_tsvector('simple', coalesce(name, '')))",
+            'CREATE INDEX "ix_{table}_name_trgm" ON "{table}" USING gin (name gin_trgm_ops)'):
+        event.listen(table, 'after_create', DDL(statement.format(table=table.name)).execute_if(dialect='postgresql'))
+    for statement in (
+            "CREATE VIRTUAL TABLE {fts} USING fts5(name, content='{table}', content_rowid='id')",
+            'CREATE TRIGGER {fts}_ai AFTER INSERT ON "{table}" BEGIN '
+            'INSERT INTO {fts}(rowid, name) VALUES (new.id, new.name); END',
+            'CREATE TRIGGER {fts}_ad AFTER DELETE ON "{table}" BEGIN '
+            "INSERT INTO {fts}({fts}, rowid, name) VALUES ('delete', old.id, old.name); END",
+            'CREATE TRIGGER {fts}_au AFTER UPDATE OF name ON "{table}" BEGIN '
+            "INSERT INTO {fts}({fts}, rowid, name) VALUES ('delete', old.id, old.name); "
+            'INSERT INTO {fts}(rowid, name) VALUES (new.id, new.name); END'):
+        event.listen(table, 'after_create', DDL(statement.format(table=table.name, fts=fts)).execute_if(dialect='sqlite'))
+    event.listen(table, 'before_drop', DDL('DROP TABLE IF EXISTS {}'.format(fts)).execute_if(dialect='sqlite'))
+
+search_index_ddl(Venue.__table__, 'venue_fts')
+search_index_ddl(Artist.__table__, 'artist_fts')
+# endregion
+
+# endregion
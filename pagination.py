@@ -0,0 +1,111 @@
+import json
+import base64
+from datetime import datetime
+from flask import current_app, request, abort
+from models import db
+
+# region Keyset pagination
+
+def encode_cursor(values):
+    """ The function encode the sort key values of a row into an opaque cursor
+        that can be passed back in the url.
+
+    Args:
+       values: sort key values of the row (list)
+
+    Returns:
+       Cursor (string)
+    """
+    values = [value.isoformat() if isinstance(value, datetime) else value
+              for value in values]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor, columns):
+    """ The function decode a cursor made by encode_cursor back into the sort
+        key values of the given columns.
+
+    Args:
+       cursor: cursor (string)
+       columns: sort key columns the cursor was made from
+
+    Returns:
+       Sort key values (list), raise ValueError for a malformed cursor
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise ValueError('Invalid cursor')
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError('Invalid cursor')
+    for value, column in zip(values, columns):
+        # The values are compared with the columns in SQL, a value of another
+        # type would fail there instead of as a bad request
+        python_type = str if isinstance(column.type, db.DateTime) else column.type.python_type
+        if not isinstance(value, python_type) or isinstance(value, bool):
+            raise ValueError('Invalid cursor')
+    return [datetime.fromisoformat(value) if isinstance(column.type, db.DateTime) else value
+            for value, column in zip(values, columns)]
+
+
+def keyset_page(query, columns, page_size, after=None, before=None):
+    """ The function fetch one page of the query ordered by the given columns
+        using keyset (seek) pagination, the last column must be unique (id).
+
+    Args:
+       query: query selecting at least the sort key columns
+       columns: sort key columns
+       page_size: number of rows in page (int)
+       after: cursor of the row the page starts after (string)
+       before: cursor of the row the page ends before (string)
+
+    Returns:
+       Rows of the page (list), cursor of the previous page and cursor of
+       the next page (None when there is no such page)
+    """
+    key = db.tuple_(*columns)
+    if before:
+        query = query.filter(key < db.tuple_(*decode_cursor(before, columns))).order_by(
+            *[column.desc() for column in columns])
+    else:
+        if after:
+            query = query.filter(key > db.tuple_(*decode_cursor(after, columns)))
+        query = query.order_by(*columns)
+    rows = query.limit(page_size + 1).all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if before:
+        rows.reverse()
+
+    prev_cursor = None
+    next_cursor = None
+    if rows:
+        row_key = lambda row: [getattr(row, column.key) for column in columns]
+        if (before and has_more) or after:
+            prev_cursor = encode_cursor(row_key(rows[0]))
+        if before or has_more:
+            next_cursor = encode_cursor(row_key(rows[-1]))
+    return rows, prev_cursor, next_cursor
+
+
+def paginate(query, columns):
+    """ The function fetch the page of the query requested by the after/before
+        cursors and per_page size in the request url.
+
+    Args:
+       query: query selecting at least the sort key columns
+       columns: sort key columns, the last one must be unique (id)
+
+    Returns:
+       Rows of the page, previous page cursor and next page cursor
+       or ERROR 400 for invalid cursor
+    """
+    page_size = request.args.get('per_page', current_app.config['PAGE_SIZE'], type=int)
+    page_size = min(max(page_size, 1), current_app.config['MAX_PAGE_SIZE'])
+    try:
+        return keyset_page(query, columns, page_size,
+                           after=request.args.get('after'), before=request.args.get('before'))
+    except ValueError:
+        abort(400)
+
+# endregion
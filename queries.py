@@ -0,0 +1,270 @@
+from datetime import datetime
+from flask import current_app
+from models import db, Artist, Venue, Show, ShowArchive, Genre, venue_genres, artist_genres
+from pagination import paginate
+import search
+
+# region Query helpers
+# Data of the read pages, shared by the html views in app.py and the json api.
+
+def venue_areas(genre=None):
+    """ The function fetch one page of venues grouped into city/state areas.
+        Venues and their upcoming shows counter are fetched with one range
+        read of the Venue (state, city, name, id) index and grouped into
+        city/state areas in Python.
+
+    Args:
+       genre: genre name the venues are filtered by (string)
+
+    Returns:
+       Areas of city, state and venues (list), previous and next page cursors
+    """
+    Venues_query = db.session.query(
+        Venue.id, Venue.name, Venue.city, Venue.state, Venue.upcoming_shows_count)
+    if genre:
+        Venues_query = Venues_query.join(venue_genres).join(Genre).filter(Genre.name == genre)
+    Venues, prev_cursor, next_cursor = paginate(
+        Venues_query, [Venue.state, Venue.city, Venue.name, Venue.id])
+    areas = []
+    area_by_city_state = {}
+    for id, name, city, state, upcoming in Venues:
+        if (city, state) not in area_by_city_state:
+            area_by_city_state[(city, state)] = {
+                "city": city, "state": state, "venues": []}
+            areas.append(area_by_city_state[(city, state)])
+        area_by_city_state[(city, state)]["venues"].append(
+            {"id": id, "name": name, "num_upcoming_shows": upcoming})
+    return areas, prev_cursor, next_cursor
+
+
+def artist_list(genre=None):
+    """ The function fetch one page of artists ordered by name.
+
+    Args:
+       genre: genre name the artists are filtered by (string)
+
+    Returns:
+       Artists id and name (list), previous and next page cursors
+    """
+    Artists_query = db.session.query(Artist.id, Artist.name)
+    if genre:
+        Artists_query = Artists_query.join(artist_genres).join(Genre).filter(Genre.name == genre)
+    All_Artists, prev_cursor, next_cursor = paginate(
+        Artists_query, [Artist.name, Artist.id])
+    artists = []
+    for id, name in All_Artists:
+        artists.append({"id": id, "name": name})
+    return artists, prev_cursor, next_cursor
+
+
+def show_rows(Model, *criterion):
+    """ The function build the select of the shows of Shows or ShowsArchive
+        with their venue and artist names, the two can be joined by union.
+
+    Args:
+       Model: Show or ShowArchive
+       criterion: filters on Model selecting the shows
+
+    Returns:
+       Select of show id, start and end time, venue id and name, artist id,
+       name and image link
+    """
+    return db.session.query(
+        Model.id.label('id'), Model.start_time.label('start_time'), Model.end_time.label('end_time'),
+        Model.venue_id.label('venue_id'), Venue.name.label('venue_name'), Model.artist_id.label('artist_id'),
+        Artist.name.label('artist_name'), Artist.image_link.label('image_link')).join(
+        Venue, Model.venue_id == Venue.id).join(Artist, Model.artist_id == Artist.id).filter(*criterion).statement
+
+
+def show_list():
+    """ The function fetch one page of shows ordered by start time, archived
+        shows included.
+
+    Returns:
+       Shows with venue and artist names (list), previous and next page cursors
+    """
+    All_Shows_query = db.union_all(show_rows(Show), show_rows(ShowArchive)).subquery('shows')
+    All_Shows, prev_cursor, next_cursor = paginate(
+        db.session.query(All_Shows_query), [All_Shows_query.c.start_time, All_Shows_query.c.id])
+    shows = []
+    for show in All_Shows:
+        show_data = {"venue_id": show.venue_id,
+             "venue_name": show.venue_name,
+             "artist_id": show.artist_id,
+             "artist_name": show.artist_name,
+             "artist_image_link": show.image_link,
+             "start_time": show.start_time}
+        shows.append(show_data)
+    return shows, prev_cursor, next_cursor
+
+
+def venue_search(search_term):
+    """ The function search on venues by name with ranked full text and partial string search.
+
+    Args:
+       search_term: search string (string)
+
+    Returns:
+       Results count and data of venue id, name and num_upcoming_shows (dict)
+    """
+    All_Venues = search.search_venues(search_term, current_app.config['SEARCH_RESULT_LIMIT'])
+    result = []
+    for id, name, num_upcoming_shows in All_Venues:
+        result.append({
+            "id": id,
+            "name": name,
+            "num_upcoming_shows": num_upcoming_shows
+        })
+    return {"count": len(All_Venues), "data": result}
+
+
+def artist_search(search_term):
+    """ The function search on artists by name with ranked full text and partial string search.
+
+    Args:
+       search_term: search string (string)
+
+    Returns:
+       Results count and data of artist id, name and num_upcoming_shows (dict)
+    """
+    All_Artists_Result = search.search_artists(search_term, current_app.config['SEARCH_RESULT_LIMIT'])
+    artists = []
+    for id, name, num_upcoming_shows in All_Artists_Result:
+        artists.append({
+            "id": id,
+            "name": name,
+            "num_upcoming_shows": num_upcoming_shows
+        })
+    return {"count": len(All_Artists_Result), "data": artists}
+
+
+def archived_shows(criterion, Other, other_fk):
+    """ The function fetch the archived shows of a venue or an artist, oldest first.
+
+    Args:
+       criterion: filter on ShowArchive selecting the shows
+       Other: model on the other side of the shows, Artist or Venue
+       other_fk: ShowArchive column referencing Other
+
+    Returns:
+       Rows of start time, id, name, image link and is_past like the Shows rows (list)
+    """
+    return db.session.query(ShowArchive.start_time, Other.id, Other.name, Other.image_link, db.true()).join(
+        Other, other_fk == Other.id).filter(criterion).order_by(ShowArchive.start_time).all()
+
+
+def archived_count(Model, Shows):
+    # Past counters include archived shows, the Shows rows rolled over to the
+    # past are the rest of them
+    return max(0, Model.past_shows_count - sum(1 for row in Shows if row[-1]))
+
+
+def venue_detail(venue_id, archived=False):
+    """ The function fetch the venue properties with its past and upcoming shows.
+        Archived shows are only read when asked for, else counted from the
+        past shows counter.
+
+    Args:
+       venue_id: venue id is primary key and use to query any Venue by its id
+       archived: also list the archived past shows (bool)
+
+    Returns:
+       Venue properties and shows (dict) or None when venue does not exist
+    """
+    VenueById = Venue.query.options(db.joinedload(Venue.genres)).get(venue_id)
+    if VenueById is None:
+        return None
+    now = datetime.now()
+    ShowByVenue = db.session.query(Show.start_time, Artist.id, Artist.name, Artist.image_link, Show.is_past).join(
+        Artist, Show.artist).filter(Show.venue_id == venue_id).order_by(Show.start_time).all()
+    if archived:
+        Archived = archived_shows(ShowArchive.venue_id == venue_id, Artist, ShowArchive.artist_id)
+        archived_shows_count = len(Archived)
+        ShowByVenue = Archived + ShowByVenue
+    else:
+        archived_shows_count = archived_count(VenueById, ShowByVenue)
+
+    upcoming_shows = []
+    past_shows = []
+    for start_time, artist_id, artist_name, artist_image_link, is_past in ShowByVenue:
+        show = {"artist_id": artist_id, "artist_name": artist_name,
+                "artist_image_link": artist_image_link, "start_time": start_time}
+        if start_time > now:
+            upcoming_shows.append(show)
+        else:
+            past_shows.append(show)
+
+    return {"id": venue_id,
+         "name": VenueById.name,
+         "genres": [genre.name for genre in VenueById.genres],
+         "address": VenueById.address,
+         "city": VenueById.city,
+         "state": VenueById.state,
+         "phone": VenueById.phone,
+         "website": VenueById.website,
+         "facebook_link": VenueById.facebook_link,
+         "seeking_talent": VenueById.seeking_talent,
+         "seeking_description": VenueById.seeking_description,
+         "image_link": VenueById.image_link,
+         "past_shows": past_shows,
+         "upcoming_shows": upcoming_shows,
+         "past_shows_count": len(past_shows) + (0 if archived else archived_shows_count),
+         "upcoming_shows_count": len(upcoming_shows),
+         "archived_shows_count": archived_shows_count,
+         }
+
+
+def artist_detail(artist_id, archived=False):
+    """ The function fetch the artist properties with its past and upcoming shows.
+        Archived shows are only read when asked for, else counted from the
+        past shows counter.
+
+    Args:
+       artist_id: artist id is primary key and use to query any Artist by its id
+       archived: also list the archived past shows (bool)
+
+    Returns:
+       Artist properties and shows (dict) or None when artist does not exist
+    """
+    ArtistById = Artist.query.options(db.joinedload(Artist.genres)).get(artist_id)
+    if ArtistById is None:
+        return None
+    now = datetime.now()
+    ShowByArtist = db.session.query(Show.start_time, Venue.id, Venue.name, Venue.image_link, Show.is_past).join(
+        Venue, Show.venue).filter(Show.artist_id == artist_id).order_by(Show.start_time).all()
+    if archived:
+        Archived = archived_shows(ShowArchive.artist_id == artist_id, Venue, ShowArchive.venue_id)
+        archived_shows_count = len(Archived)
+        ShowByArtist = Archived + ShowByArtist
+    else:
+        archived_shows_count = archived_count(ArtistById, ShowByArtist)
+
+    upcoming_shows = []
+    past_shows = []
+    for start_time, venue_id, venue_name, venue_image_link, is_past in ShowByArtist:
+        show = {"venue_id": venue_id, "venue_name": venue_name,
+                "venue_image_link": venue_image_link, "start_time": start_time}
+        if start_time > now:
+            upcoming_shows.append(show)
+        else:
+            past_shows.append(show)
+
+    return {"id": artist_id,
+         "name": ArtistById.name,
+         "genres": [genre.name for genre in ArtistById.genres],
+         "city": ArtistById.city,
+         "state": ArtistById.state,
+         "phone": ArtistById.phone,
+         "website": ArtistById.website,
+         "facebook_link": ArtistById.facebook_link,
+         "seeking_venue": ArtistById.seeking_venue,
+         "seeking_description": ArtistById.seeking_description,
+         "image_link": ArtistById.image_link,
+         "past_shows": past_shows,
+         "upcoming_shows": upcoming_shows,
+         "past_shows_count": len(past_shows) + (0 if archived else archived_shows_count),
+         "upcoming_shows_count": len(upcoming_shows),
+         "archived_shows_count": archived_shows_count,
+         }
+
+# endregion
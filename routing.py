@@ -0,0 +1,81 @@
+import time
+import random
+from functools import wraps
+from flask import g, session, current_app, has_request_context
+from flask_sqlalchemy import SQLAlchemy, SignallingSession, get_state
+from sqlalchemy import event, orm
+
+# region Read replica routing
+# Views marked with read_replica run their queries on one of the
+# SQLALCHEMY_REPLICA_URIS, everything else (flushes, commits, cli commands)
+# uses the primary. A request that commits makes its client read from the
+# primary for REPLICA_STICKY_SECONDS so it sees its own writes despite
+# replication lag.
+
+POOL_OPTIONS = ('pool_size', 'max_overflow', 'pool_timeout')
+
+
+class RoutingSession(SignallingSession):
+    """ Session that sends the reads of replica views to the replica chosen
+        for the request.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if not self._flushing and has_request_context() and g.get('replica_bind'):
+            return get_state(self.app).db.get_engine(self.app, bind=g.replica_bind)
+        return super().get_bind(mapper, clause)
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def stick_to_primary(db_session):
+    if has_request_context():
+        g.committed = True
+
+
+class RoutingSQLAlchemy(SQLAlchemy):
+    """ SQLAlchemy with read replicas registered as replica_<n> binds. """
+
+    def init_app(self, app):
+        app.config.setdefault('SQLALCHEMY_REPLICA_URIS', [])
+        app.config.setdefault('REPLICA_STICKY_SECONDS', 5)
+        binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+        for index, uri in enumerate(app.config['SQLALCHEMY_REPLICA_URIS']):
+            binds['replica_{}'.format(index)] = uri
+        app.config['SQLALCHEMY_BINDS'] = binds
+        super().init_app(app)
+
+        @app.after_request
+        def remember_write(response):
+            if g.get('committed'):
+                session['primary_until'] = time.time() + app.config['REPLICA_STICKY_SECONDS']
+            return response
+
+    def create_session(self, options):
+        return orm.sessionmaker(class_=RoutingSession, db=self, **options)
+
+    def create_engine(self, sa_url, engine_opts):
+        # SQLite uses a NullPool or StaticPool which take no pool size options
+        if sa_url.drivername.startswith('sqlite'):
+            engine_opts = {key: value for key, value in engine_opts.items() if key not in POOL_OPTIONS}
+        return super().create_engine(sa_url, engine_opts)
+
+
+def use_replica():
+    """ The function route the queries of the current request to a random
+        replica, unless there is none or the client wrote recently.
+    """
+    replicas = current_app.config['SQLALCHEMY_REPLICA_URIS']
+    if replicas and session.get('primary_until', 0) < time.time():
+        g.replica_bind = 'replica_{}'.format(random.randrange(len(replicas)))
+
+
+def read_replica(view):
+    """ Decorator of read only views whose queries may run on a replica. """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        use_replica()
+        return view(*args, **kwargs)
+    return wrapper
+
+# endregion
@@ -0,0 +1,83 @@
+import re
+from models import db, Artist, Venue
+
+# region Search engine
+
+# FTS5 tables kept in sync with the Venue and Artist names on SQLite
+# (see the search indexes region in models.py).
+venue_fts = db.table('venue_fts', db.column('rowid'), db.column('venue_fts'), db.column('rank'))
+artist_fts = db.table('artist_fts', db.column('rowid'), db.column('artist_fts'), db.column('rank'))
+
+
+def search_terms(search_term):
+    """ The function split the search string into words, dropping any
+        punctuation that has a meaning in tsquery or FTS5 query syntax.
+
+    Args:
+       search_term: search string (string)
+
+    Returns:
+       Words (list)
+    """
+    return re.findall(r'\w+', search_term or '')
+
+
+def search_venues(search_term, limit):
+    """ The function search on venue names ranked by relevance with the
+        upcoming shows count of every result.
+
+    Args:
+       search_term: search string (string)
+       limit: maximum number of results (int)
+
+    Returns:
+       Rows of id, name and num_upcoming_shows (list)
+    """
+    return _search(Venue, venue_fts, search_term, limit)
+
+
+def search_artists(search_term, limit):
+    """ The function search on artist names ranked by relevance with the
+        upcoming shows count of every result.
+
+    Args:
+       search_term: search string (string)
+       limit: maximum number of results (int)
+
+    Returns:
+       Rows of id, name and num_upcoming_shows (list)
+    """
+    return _search(Artist, artist_fts, search_term, limit)
+
+
+def _search(Model, fts, search_term, limit):
+    query = db.session.query(Model.id, Model.name, Model.upcoming_shows_count)
+    words = search_terms(search_term)
+    dialect = db.engine.dialect.name
+
+    if dialect == 'postgresql':
+        # Whole word prefixes hit the tsvector GIN index, partial strings hit
+        # the pg_trgm GIN index on name.
+        pattern = '%{}%'.format(search_term or '')
+        if not words:
+            query = query.filter(Model.name.ilike(pattern)).order_by(Model.name)
+        else:
+            vector = db.func.to_tsvector('simple', db.func.coalesce(Model.name, ''))
+            tsquery = db.func.to_tsquery('simple', ' & '.join(word + ':*' for word in words))
+            query = query.filter(db.or_(vector.op('@@')(tsquery), Model.name.ilike(pattern))).order_by(
+                db.func.ts_rank(vector, tsquery).desc(),
+                db.func.similarity(Model.name, search_term).desc(),
+                Model.name)
+    elif dialect == 'sqlite' and words:
+        # As on Postgres, FTS5 word prefix matches rank first and partial
+        # strings are still found by name.
+        match = ' AND '.join('"{}"*'.format(word) for word in words)
+        ranked = db.select(fts.c.rowid, fts.c.rank).where(fts.c[fts.name].op('MATCH')(match)).subquery()
+        query = query.outerjoin(ranked, ranked.c.rowid == Model.id).filter(
+            db.or_(ranked.c.rowid.isnot(None), Model.name.ilike('%{}%'.format(search_term)))).order_by(
+            ranked.c.rank.is_(None), ranked.c.rank, Model.name)
+    else:
+        query = query.filter(Model.name.ilike('%{}%'.format(search_term or ''))).order_by(Model.name)
+    return query.limit(limit).all()
+
+# endregion
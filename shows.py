@@ -0,0 +1,155 @@
+from flask import Blueprint, render_template, request, Response, flash, abort, jsonify, current_app, stream_with_context
+from forms import ShowForm, ShowBatchForm
+from models import db, Artist, Venue, Show
+import queries
+from jobs import jobs
+from routing import read_replica
+from counters import count_new_show
+from conflicts import show_end_time, find_conflicts
+from booking import parse_show_lines, repeat_shows, create_show_batch
+from exporter import EXPORT_FORMATS, parse_export_filters, export_query, export_shows
+
+# region Show views
+
+show_pages = Blueprint('shows', __name__)
+
+
+@show_pages.route('/shows')
+@read_replica
+def shows():
+    """ The function displays one page of shows in database ordered by start time.
+
+    Returns:
+       Render shows page with artist name,venue name and start time   
+    """
+    shows, prev_cursor, next_cursor = queries.show_list()
+    return render_template('pages/shows.html', shows=shows, prev_cursor=prev_cursor, next_cursor=next_cursor)
+
+
+@show_pages.route('/shows/create')
+def create_shows():
+    form = ShowForm()
+    return render_template('forms/new_show.html', form=form)
+
+
+@show_pages.route('/shows/create', methods=['POST'])
+def create_show_submission():
+    """ The function create new show with venue id,artist id and start time
+        filled into Show Form and insert new show to database   
+
+    Returns:
+       Render Home Page with flash for successed or faild   
+    """
+    Show_form = ShowForm(request.form)
+    Valid_Artist_Id = Artist.query.get(Show_form.artist_id.data)
+    Valid_Venue_Id = Venue.query.get(Show_form.venue_id.data)
+    if(Valid_Venue_Id==None or Valid_Artist_Id==None):
+        flash('Venue or Artist not found. Show could not be listed.')
+        return render_template('pages/home.html')
+    try:
+        New_Show = Show()
+        New_Show.venue_id = Show_form.venue_id.data
+        New_Show.artist_id = Show_form.artist_id.data
+        New_Show.start_time = Show_form.start_time.data
+        New_Show.end_time = show_end_time(New_Show.start_time, request.form.get('duration'))
+        if find_conflicts([{"venue_id": Valid_Venue_Id.id, "start_time": New_Show.start_time,
+                            "end_time": New_Show.end_time}]):
+            flash('Venue is already booked at that time. Show could not be listed.')
+            return render_template('pages/home.html')
+        count_new_show(New_Show)
+        db.session.add(New_Show)
+        venue_id, artist_id = Valid_Venue_Id.id, Valid_Artist_Id.id
+        db.session.commit()
+        jobs.enqueue('invalidate_pages', 'venue', [venue_id])
+        jobs.enqueue('invalidate_pages', 'artist', [artist_id])
+        flash('Show was successfully listed!')
+    except ValueError as error:
+        db.session.rollback()
+        flash('Show could not be listed, ' + str(error) + '.')
+    except:
+        db.session.rollback()
+        flash('An error occurred. Show could not be listed.')
+    finally:
+        db.session.close()
+    return render_template('pages/home.html')
+
+
+@show_pages.route('/shows/batch')
+def create_show_batch_form():
+    form = ShowBatchForm()
+    return render_template('forms/new_show_batch.html', form=form, errors=[])
+
+
+@show_pages.route('/shows/batch', methods=['POST'])
+def create_show_batch_submission():
+    """ The function create many shows at once, listed one per line or as a
+        recurrence of one artist at one venue, in a single transaction.
+        A json body holds either a "shows" list of artist_id, venue_id,
+        start_time and duration or artist_id, venue_id, start_time, duration,
+        repeat and count.
+
+    Returns:
+       Render Home Page with flash when created or the form with row errors,
+       json of created count and row errors for json requests
+    """
+    max_shows = current_app.config['SHOW_BATCH_MAX']
+    if request.is_json:
+        Batch = request.get_json(silent=True)
+        Batch = Batch if isinstance(Batch, dict) else {}
+    else:
+        Batch_Form = ShowBatchForm(request.form)
+        Batch = {"artist_id": request.form.get('artist_id'), "venue_id": request.form.get('venue_id'),
+                 "start_time": request.form.get('start_time'), "duration": request.form.get('duration'),
+                 "repeat": request.form.get('repeat'), "count": request.form.get('count')}
+        if (request.form.get('shows') or '').strip():
+            Batch = {"shows": parse_show_lines(request.form['shows'])}
+    created = []
+    try:
+        if "shows" in Batch:
+            shows = Batch["shows"] if isinstance(Batch["shows"], list) else []
+            shows = [show if isinstance(show, dict) else {} for show in shows]
+        elif Batch.get('repeat'):
+            shows = repeat_shows(Batch.get('artist_id'), Batch.get('venue_id'), Batch.get('start_time'),
+                                 Batch.get('duration'), Batch['repeat'], Batch.get('count'), max_shows)
+        else:
+            shows = [Batch]
+        created, errors = create_show_batch(shows, max_shows)
+        if created:
+            jobs.enqueue('invalidate_pages', 'venue', sorted({row['venue_id'] for row in created}))
+            jobs.enqueue('invalidate_pages', 'artist', sorted({row['artist_id'] for row in created}))
+    except ValueError as error:
+        errors = [(0, str(error))]
+    except:
+        db.session.rollback()
+        errors = [(0, 'An error occurred. Shows could not be listed.')]
+    finally:
+        db.session.close()
+    if request.is_json:
+        return jsonify({"created": len(created),
+                        "errors": [{"row": row, "message": message} for row, message in errors]}), 400 if errors else 201
+    if errors:
+        return render_template('forms/new_show_batch.html', form=Batch_Form, errors=errors)
+    flash('{} shows were successfully listed!'.format(len(created)))
+    return render_template('pages/home.html')
+
+
+@show_pages.route('/export/shows.<any(csv, ndjson, ics):format>')
+def export_shows_file(format):
+    """ The function stream all shows matching the start, end, venue_id and
+        artist_id url filters as csv, ndjson or icalendar.
+
+    Args:
+       format: export format, csv, ndjson or ics
+
+    Returns:
+       Streamed export file or ERROR 400 for invalid filters
+    """
+    try:
+        filters = parse_export_filters(request.args)
+    except ValueError:
+        abort(400)
+    return Response(stream_with_context(export_shows(format, export_query(**filters))),
+                    mimetype=EXPORT_FORMATS[format],
+                    headers={'Content-Disposition': 'attachment; filename=shows.' + format})
+
+# endregion
@@ -0,0 +1,41 @@
+import os
+import sys
+from types import SimpleNamespace
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SECRET_KEY', 'test-secret-key')
+
+import config
+from app import create_app
+from models import db
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    """ Factory of apps on a SQLite database of the test, every app made by a
+        test shares the database.
+    """
+    def make(**settings):
+        options = {key: getattr(config, key) for key in dir(config) if key.isupper()}
+        options.update(
+            SQLALCHEMY_DATABASE_URI='sqlite:///{}'.format(tmp_path / 'fyyur.db'),
+            SQLALCHEMY_REPLICA_URIS=[],
+            JOBS_DATABASE=str(tmp_path / 'jobs.sqlite'),
+            JOBS_WORKERS=0,
+            IMAGE_CACHE_DIR=str(tmp_path / 'image_cache'),
+            CACHE_TYPE='null',
+            TESTING=True,
+            WTF_CSRF_ENABLED=False,
+        )
+        options.update(settings)
+        app = create_app(SimpleNamespace(**options))
+        with app.app_context():
+            db.create_all()
+        return app
+    return make
+
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
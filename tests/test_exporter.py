@@ -0,0 +1,51 @@
+import json
+from datetime import datetime, timedelta
+from models import db, Venue, Artist, Show
+from archive import archive_shows
+
+
+def add_shows(app):
+    now = datetime.now().replace(microsecond=0)
+    with app.app_context():
+        venue = Venue(name='The Musical Hop', city='San Francisco', state='CA')
+        artist = Artist(name='Guns N Petals', city='San Francisco', state='CA')
+        db.session.add_all([venue, artist])
+        db.session.flush()
+        for days in (-400, -300, 10):
+            db.session.add(Show(venue_id=venue.id, artist_id=artist.id, start_time=now + timedelta(days=days),
+                                end_time=now + timedelta(days=days, hours=2), is_past=days < 0))
+        db.session.commit()
+        assert archive_shows(now - timedelta(days=200)) == 2
+    return now
+
+
+def test_export_includes_archived_shows(app):
+    now = add_shows(app)
+    lines = app.test_client().get('/export/shows.ndjson').get_data(as_text=True).splitlines()
+    shows = [json.loads(line) for line in lines]
+    assert [show["start_time"] for show in shows] == [
+        (now + timedelta(days=days)).isoformat() for days in (-400, -300, 10)]
+    assert {show["venue_name"] for show in shows} == {'The Musical Hop'}
+
+    lines = app.test_client().get('/export/shows.ndjson?start={}'.format(
+        (now - timedelta(days=350)).isoformat())).get_data(as_text=True).splitlines()
+    assert len(lines) == 2
+
+
+def test_shows_list_includes_archived_shows(app):
+    now = add_shows(app)
+    client = app.test_client()
+    first = client.get('/api/v1/shows?per_page=2').get_json()
+    second = client.get('/api/v1/shows', query_string={'per_page': 2, 'after': first["next_cursor"]}).get_json()
+    assert len(first["shows"]) == 2 and len(second["shows"]) == 1
+    assert second["shows"][0]["artist_name"] == 'Guns N Petals'
+    assert second["next_cursor"] is None
+
+
+def test_export_command_writes_every_show(app):
+    add_shows(app)
+    result = app.test_cli_runner().invoke(args=['export-shows', 'csv'])
+    assert result.exit_code == 0
+    assert len(result.output.splitlines()) == 4
+    result = app.test_cli_runner().invoke(args=['export-shows', 'csv', '--no-archived'])
+    assert len(result.output.splitlines()) == 2
@@ -0,0 +1,95 @@
+import io
+import os
+import pytest
+from PIL import Image
+from models import db, Venue
+from images import ImageCache, image_digest
+
+
+@pytest.fixture
+def image_app(make_app, tmp_path):
+    root = tmp_path / 'images'
+    root.mkdir()
+    Image.new('RGB', (1200, 600), 'purple').save(root / 'hall.jpg')
+    Image.new('RGB', (100, 100), 'red').save(tmp_path / 'secret.jpg')
+    return make_app(IMAGE_LOCAL_ROOT=str(root))
+
+
+def add_venue(app, image_link):
+    with app.app_context():
+        venue = Venue(name='The Musical Hop', city='San Francisco', state='CA', image_link=image_link)
+        db.session.add(venue)
+        db.session.commit()
+        return venue.id
+
+
+@pytest.mark.parametrize('accept, mimetype, format', [
+    ('image/webp,image/*,*/*;q=0.8', 'image/webp', 'WEBP'),
+    ('image/png,image/svg+xml,image/*;q=0.8,*/*;q=0.5', 'image/jpeg', 'JPEG'),
+    ('image/webp;q=0,image/*', 'image/jpeg', 'JPEG'),
+    (None, 'image/jpeg', 'JPEG'),
+])
+def test_format_follows_accept(image_app, accept, mimetype, format):
+    id = add_venue(image_app, 'hall.jpg')
+    headers = {'Accept': accept} if accept else {}
+    response = image_app.test_client().get('/img/venue/{}/tile'.format(id), headers=headers)
+    assert response.status_code == 200
+    assert response.mimetype == mimetype
+    assert 'Accept' in response.vary
+    with Image.open(io.BytesIO(response.data)) as thumbnail:
+        assert thumbnail.format == format
+        assert thumbnail.size == (320, 160)
+
+
+def test_versioned_url_is_immutable(image_app):
+    id = add_venue(image_app, 'hall.jpg')
+    client = image_app.test_client()
+    response = client.get('/img/venue/{}/tile?v={}'.format(id, image_digest('hall.jpg')))
+    assert response.cache_control.immutable
+    assert response.cache_control.max_age == 31536000
+    response = client.get('/img/venue/{}/tile?v=stale'.format(id))
+    assert not response.cache_control.immutable
+    assert response.cache_control.max_age == image_app.config['IMAGE_MAX_AGE']
+
+
+def test_matching_etag_is_not_modified(image_app):
+    id = add_venue(image_app, 'hall.jpg')
+    client = image_app.test_client()
+    etag = client.get('/img/venue/{}/tile'.format(id)).get_etag()[0]
+    response = client.get('/img/venue/{}/tile'.format(id), headers={'If-None-Match': '"{}"'.format(etag)})
+    assert response.status_code == 304
+    assert not response.data
+    # The other format has another etag
+    response = client.get('/img/venue/{}/tile'.format(id), headers={'If-None-Match': '"{}"'.format(etag),
+                                                                    'Accept': 'image/webp'})
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('link', [
+    '../secret.jpg', 'file:///../secret.jpg', '/../../secret.jpg', 'missing.jpg',
+    'http://127.0.0.1/hall.jpg', 'http://localhost:5000/hall.jpg', 'https://10.0.0.1/hall.jpg',
+    'http://[::1]/hall.jpg', 'ftp://example.com/hall.jpg',
+])
+def test_unreadable_links_are_not_found(image_app, link):
+    id = add_venue(image_app, link)
+    assert image_app.test_client().get('/img/venue/{}/tile'.format(id)).status_code == 404
+
+
+def test_unknown_kind_size_or_id_is_not_found(image_app):
+    id = add_venue(image_app, 'hall.jpg')
+    client = image_app.test_client()
+    for url in ('/img/show/{}/tile', '/img/venue/{}/huge', '/img/artist/{}/tile'):
+        assert client.get(url.format(id)).status_code == 404
+
+
+def test_cache_evicts_least_recently_used_files(tmp_path):
+    cache = ImageCache(str(tmp_path / 'cache'), 250)
+    cache.set('a', b'a' * 100)
+    cache.set('b', b'b' * 100)
+    os.utime(cache.path('a'), (1000, 1000))
+    os.utime(cache.path('b'), (2000, 2000))
+    assert cache.get('a') == cache.path('a')
+    cache.set('c', b'c' * 100)
+    assert cache.get('b') is None
+    assert cache.get('a') and cache.get('c')
+    assert sorted(os.listdir(cache.directory)) == ['a', 'c']
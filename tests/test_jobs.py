@@ -0,0 +1,65 @@
+import sqlite3
+import time
+from jobs import jobs, TASKS
+
+CALLS = []
+
+
+@jobs.task
+def record_call(value):
+    CALLS.append(value)
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.02)
+    return condition()
+
+
+def test_worker_survives_job_table_errors(make_app):
+    app = make_app(JOBS_WORKERS=1, JOBS_POLL_INTERVAL=0.05)
+    runner = app.extensions['job_queue']
+    claim = runner.store.claim
+    failures = []
+
+    def failing_claim(*args):
+        if not failures:
+            failures.append(1)
+            raise sqlite3.OperationalError('database is locked')
+        return claim(*args)
+    runner.store.claim = failing_claim
+    CALLS.clear()
+    with app.app_context():
+        jobs.enqueue('record_call', 1)
+    assert wait_for(lambda: CALLS == [1])
+    assert failures and runner.threads[0].is_alive()
+    assert runner.store.depth() == {}
+    runner.stopping.set()
+
+
+def test_start_replaces_dead_workers(make_app):
+    app = make_app(JOBS_WORKERS=2, JOBS_POLL_INTERVAL=0.05)
+    runner = app.extensions['job_queue']
+    runner.stopping.set()
+    runner.start(2)
+    assert wait_for(lambda: not any(thread.is_alive() for thread in runner.threads))
+    runner.stopping.clear()
+    dead = list(runner.threads)
+    CALLS.clear()
+    with app.app_context():
+        jobs.enqueue('record_call', 2)
+    assert all(thread.is_alive() for thread in runner.threads)
+    assert not set(dead) & set(runner.threads)
+    assert wait_for(lambda: CALLS == [2])
+    runner.stopping.set()
+
+
+def test_failed_job_is_retried_then_kept(make_app):
+    app = make_app(JOBS_MAX_ATTEMPTS=2, JOBS_RETRY_BACKOFF=0)
+    with app.app_context():
+        jobs.enqueue('missing_task')
+    runner = app.extensions['job_queue']
+    runner.run(1, burst=True)
+    assert runner.store.depth() == {'failed': 1}
+    assert 'missing_task' not in TASKS
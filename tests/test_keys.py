@@ -0,0 +1,66 @@
+import pytest
+from flask import session
+from flask_wtf.csrf import generate_csrf, validate_csrf
+from wtforms import ValidationError
+from models import db, Venue
+
+FLASH = b'Incorrect phone number format'
+
+
+@pytest.fixture
+def venue_id(make_app):
+    app = make_app()
+    with app.app_context():
+        venue = Venue(name='The Musical Hop', city='San Francisco', state='CA', phone='123-123-1234')
+        db.session.add(venue)
+        db.session.commit()
+        return venue.id
+
+
+def post_invalid_edit(app, venue_id):
+    response = app.test_client().post('/venues/{}/edit'.format(venue_id), data={
+        'name': 'The Musical Hop', 'city': 'San Francisco', 'state': 'CA', 'address': '1015 Folsom Street',
+        'phone': 'not a phone', 'genres': ['Jazz'], 'facebook_link': ''})
+    assert response.status_code == 302
+    return response.headers['Set-Cookie'].split(';')[0].split('=', 1)[1]
+
+
+def read_page(app, venue_id, cookie):
+    client = app.test_client()
+    client.set_cookie('localhost', app.session_cookie_name, cookie)
+    return client.get('/venues/{}'.format(venue_id)).data
+
+
+def test_flash_is_read_on_another_instance(make_app, venue_id):
+    cookie = post_invalid_edit(make_app(SECRET_KEY='k1'), venue_id)
+    assert FLASH in read_page(make_app(SECRET_KEY='k1'), venue_id, cookie)
+
+
+def test_flash_is_read_after_rotation(make_app, venue_id):
+    cookie = post_invalid_edit(make_app(SECRET_KEY='k1'), venue_id)
+    assert FLASH in read_page(make_app(SECRET_KEY='k2', SECRET_KEY_FALLBACKS=['k1']), venue_id, cookie)
+
+
+def test_cookie_of_dropped_key_is_rejected(make_app, venue_id):
+    cookie = post_invalid_edit(make_app(SECRET_KEY='k1'), venue_id)
+    assert FLASH not in read_page(make_app(SECRET_KEY='k2', SECRET_KEY_FALLBACKS=[]), venue_id, cookie)
+
+
+def csrf_token(app):
+    with app.test_request_context():
+        token = generate_csrf()
+        return token, dict(session)
+
+
+def check_csrf(app, token, session_data):
+    with app.test_request_context():
+        session.update(session_data)
+        validate_csrf(token)
+
+
+def test_csrf_token_survives_rotation(make_app):
+    token, session_data = csrf_token(make_app(SECRET_KEY='k1'))
+    check_csrf(make_app(SECRET_KEY='k1'), token, session_data)
+    check_csrf(make_app(SECRET_KEY='k2', SECRET_KEY_FALLBACKS=['k1']), token, session_data)
+    with pytest.raises(ValidationError):
+        check_csrf(make_app(SECRET_KEY='k2', SECRET_KEY_FALLBACKS=[]), token, session_data)
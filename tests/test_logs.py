@@ -0,0 +1,49 @@
+import sys
+import json
+import queue
+import logging
+from logs import JsonFormatter, DroppingQueueHandler
+
+
+def log_through_queue(handler, *args, **kwargs):
+    logger = logging.getLogger('tests.logs')
+    logger.addHandler(handler)
+    try:
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            logger.exception(*args, **kwargs)
+    finally:
+        logger.removeHandler(handler)
+
+
+def test_queued_exception_is_kept_out_of_the_message():
+    log_queue = queue.Queue()
+    log_through_queue(DroppingQueueHandler(log_queue), 'Job %s failed', 'invalidate_pages')
+    record = log_queue.get_nowait()
+    assert record.exc_info is None
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["message"] == 'Job invalidate_pages failed'
+    assert entry["exception"].startswith('Traceback (most recent call last):')
+    assert entry["exception"].endswith('ZeroDivisionError: division by zero')
+
+
+def test_formatter_formats_exception_of_a_record_not_queued():
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        record = logging.getLogger('tests.logs').makeRecord(
+            'tests.logs', logging.ERROR, __file__, 1, 'failed', None, sys.exc_info())
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["message"] == 'failed'
+    assert 'ZeroDivisionError' in entry["exception"]
+
+
+def test_full_queue_drops_and_reports_records():
+    log_queue = queue.Queue(maxsize=1)
+    handler = DroppingQueueHandler(log_queue)
+    log_through_queue(handler, 'first')
+    log_through_queue(handler, 'second')
+    assert log_queue.get_nowait().getMessage() == 'first'
+    log_through_queue(handler, 'third')
+    assert log_queue.get_nowait().getMessage() == '1 log records dropped, log queue full'
@@ -0,0 +1,36 @@
+import pytest
+from models import db, Venue
+from pagination import encode_cursor
+
+
+@pytest.mark.parametrize('url, values', [
+    ('/api/v1/shows', [1, 2]),
+    ('/api/v1/shows', ['2026-01-01T20:00:00', '2']),
+    ('/api/v1/artists', [None, 1]),
+    ('/api/v1/artists', ['Guns N Petals', True]),
+    ('/api/v1/venues', ['CA', 'San Francisco', {}, 1]),
+])
+def test_cursor_of_wrong_types_is_bad_request(app, url, values):
+    client = app.test_client()
+    assert client.get(url, query_string={'after': encode_cursor(values)}).status_code == 400
+    assert client.get(url, query_string={'before': encode_cursor(values)}).status_code == 400
+
+
+def test_cursor_pages_through_venues(app):
+    client = app.test_client()
+    with app.app_context():
+        db.session.add_all(Venue(name='Venue {}'.format(number), city='Oakland', state='CA')
+                           for number in range(5))
+        db.session.commit()
+    names = []
+    cursor = None
+    while True:
+        query = {'per_page': 2}
+        if cursor:
+            query['after'] = cursor
+        payload = client.get('/api/v1/venues', query_string=query).get_json()
+        names.extend(venue['name'] for area in payload['areas'] for venue in area['venues'])
+        cursor = payload.get('next_cursor')
+        if not cursor:
+            break
+    assert names == ['Venue {}'.format(number) for number in range(5)]
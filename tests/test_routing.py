@@ -0,0 +1,51 @@
+import time
+from models import db, Venue
+
+NEW_VENUE = {'name': 'Fresh Venue', 'city': 'Austin', 'state': 'TX', 'address': '1 Main St',
+             'phone': '123-123-1234', 'genres': ['Jazz']}
+
+
+def add_venue(app, name):
+    with app.app_context():
+        db.session.add(Venue(name=name, city='San Francisco', state='CA'))
+        db.session.commit()
+
+
+def venue_names(client, url='/api/v1/venues'):
+    payload = client.get(url).get_json()
+    return {venue["name"] for area in payload["areas"] for venue in area["venues"]}
+
+
+def make_apps(make_app, tmp_path):
+    replica_uri = 'sqlite:///{}'.format(tmp_path / 'replica.db')
+    # The replica holds other data than the primary, so the rows a request
+    # reads tell which database it read
+    add_venue(make_app(SQLALCHEMY_DATABASE_URI=replica_uri), 'Replica Hall')
+    app = make_app(SQLALCHEMY_REPLICA_URIS=[replica_uri])
+    add_venue(app, 'Primary Hall')
+    return app
+
+
+def test_replica_views_read_the_replica(make_app, tmp_path):
+    app = make_apps(make_app, tmp_path)
+    client = app.test_client()
+    assert venue_names(client) == {'Replica Hall'}
+    assert b'Replica Hall' in client.get('/venues').data
+    assert b'Replica Hall' in client.post('/venues/search', data={'search_term': 'hall'}).data
+    # Views that are not marked read the primary
+    assert b'Primary Hall' in client.get('/venues/1/edit').data
+
+
+def test_writes_go_to_the_primary_and_the_writer_reads_it(make_app, tmp_path):
+    app = make_apps(make_app, tmp_path)
+    writer = app.test_client()
+    assert writer.post('/venues/create', data=NEW_VENUE).status_code == 200
+    with app.app_context():
+        assert Venue.query.filter_by(name='Fresh Venue').count() == 1
+    assert venue_names(writer) == {'Primary Hall', 'Fresh Venue'}
+    assert venue_names(app.test_client()) == {'Replica Hall'}
+
+    with writer.session_transaction() as session:
+        assert 0 < session['primary_until'] - time.time() <= app.config['REPLICA_STICKY_SECONDS']
+        session['primary_until'] = time.time() - 1
+    assert venue_names(writer) == {'Replica Hall'}
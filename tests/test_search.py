@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+from models import db, Venue, Artist, Show
+from counters import count_new_show
+
+NAMES = ['Hop Scotch', 'Bishop Hall', 'Jazz Cellar', 'Blue Note Jazz Lounge and Supper Club Downtown',
+         'The Dueling Pianos Bar', 'Park Square Live Music & Coffee']
+
+
+def add_venues(names):
+    venues = [Venue(name=name, city='San Francisco', state='CA') for name in names]
+    db.session.add_all(venues)
+    db.session.commit()
+    return venues
+
+
+def search(app, term, kind='venues'):
+    response = app.test_client().get('/api/v1/{}/search'.format(kind), query_string={'search_term': term})
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def names(result):
+    return [row["name"] for row in result["data"]]
+
+
+def test_word_prefix_matches_rank_before_partial_strings(app):
+    with app.app_context():
+        add_venues(NAMES)
+    assert names(search(app, 'hop')) == ['Hop Scotch', 'Bishop Hall']
+    assert names(search(app, 'scot')) == ['Hop Scotch']
+    assert names(search(app, 'ishop')) == ['Bishop Hall']
+    assert names(search(app, 'music cof')) == ['Park Square Live Music & Coffee']
+    assert search(app, 'opera') == {"count": 0, "data": []}
+
+
+def test_shorter_name_ranks_first(app):
+    with app.app_context():
+        add_venues(NAMES)
+    assert names(search(app, 'jazz')) == ['Jazz Cellar', 'Blue Note Jazz Lounge and Supper Club Downtown']
+
+
+def test_results_are_capped_at_the_limit(make_app):
+    app = make_app(SEARCH_RESULT_LIMIT=3)
+    with app.app_context():
+        add_venues(['Hall {}'.format(number) for number in range(5)])
+        db.session.add_all(Artist(name='Band {}'.format(number), city='Austin', state='TX') for number in range(5))
+        db.session.commit()
+    assert search(app, 'hall')["count"] == 3
+    assert search(app, 'band', 'artists')["count"] == 3
+    assert search(app, 'al')["count"] == 3
+
+
+def test_results_carry_upcoming_shows_count(app):
+    with app.app_context():
+        venue, = add_venues(['Jazz Cellar'])
+        artist = Artist(name='Guns N Petals', city='San Francisco', state='CA')
+        db.session.add(artist)
+        db.session.flush()
+        for days in (-3, 3, 4):
+            show = Show(venue_id=venue.id, artist_id=artist.id, start_time=datetime.now() + timedelta(days=days),
+                        end_time=datetime.now() + timedelta(days=days, hours=2))
+            count_new_show(show)
+            db.session.add(show)
+        db.session.commit()
+    assert search(app, 'jazz')["data"] == [{"id": 1, "name": 'Jazz Cellar', "num_upcoming_shows": 2}]
+    assert search(app, 'petals', 'artists')["data"] == [{"id": 1, "name": 'Guns N Petals', "num_upcoming_shows": 2}]
+
+
+def test_html_search_page_lists_results(app):
+    with app.app_context():
+        add_venues(NAMES)
+    page = app.test_client().post('/venues/search', data={'search_term': 'hop'}).get_data(as_text=True)
+    assert 'Hop Scotch' in page and 'Bishop Hall' in page and 'Jazz Cellar' not in page
+
+
+def test_renamed_venue_is_found_by_its_new_name(app):
+    with app.app_context():
+        venues = add_venues(NAMES)
+        venues[0].name = 'Hop Lounge'
+        db.session.commit()
+    assert search(app, 'scotch')["count"] == 0
+    assert names(search(app, 'lounge')) == ['Hop Lounge', 'Blue Note Jazz Lounge and Supper Club Downtown']
+    # Ranked ahead of the partial string match only while the index has the new name
+    assert names(search(app, 'hop')) == ['Hop Lounge', 'Bishop Hall']
@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import event
+from models import db, Venue, Genre
+
+STATES = ['CA', 'NY', 'TX', 'WA']
+
+
+def add_venues(count):
+    jazz = Genre.get_or_create_all(['Jazz'])
+    db.session.add_all(Venue(name='Venue {}'.format(number), city='City {}'.format(number % 7),
+                             state=STATES[number % len(STATES)], phone='123-123-1234', genres=jazz)
+                       for number in range(count))
+    db.session.commit()
+
+
+def count_statements(app, url):
+    statements = []
+    with app.app_context():
+        engine = db.engine
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, 'before_cursor_execute', listener)
+    try:
+        response = app.test_client().get(url)
+    finally:
+        event.remove(engine, 'before_cursor_execute', listener)
+    assert response.status_code == 200
+    return len(statements)
+
+
+@pytest.mark.parametrize('url', ['/venues', '/venues?genre=Jazz', '/api/v1/venues'])
+def test_venues_statement_count_does_not_grow_with_venues(make_app, url):
+    app = make_app()
+    with app.app_context():
+        add_venues(5)
+    few = count_statements(app, url)
+    with app.app_context():
+        add_venues(45)
+    many = count_statements(app, url)
+    assert few == many
+    assert 1 <= many <= 2
@@ -0,0 +1,192 @@
+from flask import Blueprint, render_template, request, flash, redirect, url_for, abort, jsonify
+from forms import VenueForm, ValidPhoneNumber
+from models import db, Venue, Genre
+import queries
+from cache import page_cache
+from routing import read_replica
+from deletion import delete_venues
+from jobs import jobs
+
+# region Venue views
+
+venue_pages = Blueprint('venues', __name__)
+
+
+@venue_pages.route('/venues')
+@read_replica
+def venues():
+    """ The function show one page of venues listed by a header with city and state values,
+        filtered by the genre given in the url if any.
+
+    Returns:
+       Render venues page with venues names,city and state   
+    """
+    areas, prev_cursor, next_cursor = queries.venue_areas(request.args.get('genre'))
+    return render_template('pages/venues.html', areas=areas, prev_cursor=prev_cursor, next_cursor=next_cursor)
+
+
+@venue_pages.route('/venues/search', methods=['POST'])
+@read_replica
+def search_venues():
+    """ The function search on venues by name with ranked full text and partial string search  
+
+    Returns:
+       Render search venues page with results of venue count and venue name   
+    """
+    Response = queries.venue_search(request.form.get('search_term'))
+    return render_template('pages/search_venues.html', results=Response, search_term=request.form.get('search_term', ''))
+
+
+@venue_pages.route('/venues/<int:venue_id>')
+@read_replica
+@page_cache.cached('venue', 'venue_id')
+def show_venue(venue_id):
+    """ The function shows the venue page with the given venue_id  
+    
+    Args:
+       venue_id: venue id is primary key and use to query any Venue by its id 
+
+    Returns:
+       Render venues page for certain id with results of venue properties   
+    """
+    venue = queries.venue_detail(venue_id, archived=request.args.get('past') == 'all')
+    if venue is None:
+        abort(404)
+    return render_template('pages/show_venue.html', venue=venue)
+
+#  Create Venue
+#  ----------------------------------------------------------------
+
+
+@venue_pages.route('/venues/create', methods=['GET'])
+def create_venue_form():
+    form = VenueForm()
+    return render_template('forms/new_venue.html', form=form)
+
+
+@venue_pages.route('/venues/create', methods=['POST'])
+def create_venue_submission():
+    """ The function create new venue with properties filled into Venue Form
+        and insert new venue to database   
+
+    Returns:
+       Render Home Page with flash for successed or faild   
+    """
+    New_Venue_Form = VenueForm(request.form)
+    try:
+        New_Venue = Venue()
+        New_Venue.name = New_Venue_Form.name.data
+        New_Venue.genres = Genre.get_or_create_all(New_Venue_Form.genres.data)
+        New_Venue.city = New_Venue_Form.city.data
+        New_Venue.state = New_Venue_Form.state.data
+        New_Venue.phone = New_Venue_Form.phone.data
+        New_Venue.address = New_Venue_Form.address.data
+        New_Venue.facebook_link = New_Venue_Form.facebook_link.data
+        if(not ValidPhoneNumber(New_Venue_Form.phone.data)):
+            raise ValueError
+        db.session.add(New_Venue)
+        db.session.commit()
+        flash('Venue ' + request.form['name'] + ' was successfully listed!')
+    except ValueError:
+        db.session.rollback()
+        flash('Incorrect phone number format xxx-xxx-xxxx   (' + request.form['phone']+ '),  please try again.')
+    except:
+        db.session.rollback()
+        flash('An error occurred. Venue ' + request.form['name']+ ' could not be listed.')
+    finally:
+        db.session.close()
+    return render_template('pages/home.html')
+
+
+@venue_pages.route('/venues/<int:venue_id>', methods=['DELETE'])
+def delete_venue(venue_id):
+    """ The function delete the venue with its id and its shows from database
+    
+    Args:
+    venue_id: venue id is primary key and use to query any Venue by its id 
+
+    Returns:
+       Json of deleted venue and shows count, ERROR 404 when not found and 400 for faild
+    """
+    try:
+        Deleted = delete_venues(Venue.id == venue_id)
+    except:
+        db.session.rollback()
+        abort(400)
+    finally:
+        db.session.close()
+    if Deleted["deleted"] == 0:
+        abort(404)
+    return jsonify(Deleted)
+
+
+#  Update
+#  ----------------------------------------------------------------
+
+
+@venue_pages.route('/venues/<int:venue_id>/edit', methods=['GET'])
+def edit_venue(venue_id):
+    """ The function request venue properties by its id from database
+        and populate properties to Venue Form.   
+
+    Args: 
+       venue_id: venue id is primary key and use to query any Venue by its id 
+
+    Returns:
+       Render Edit page for venue.     
+    """
+    Update_Venue= Venue.query.options(db.joinedload(Venue.genres)).get(venue_id)
+    venue = {
+        "id": Update_Venue.id,
+        "name": Update_Venue.name,
+        "genres": [genre.name for genre in Update_Venue.genres],
+        "address":Update_Venue.address,
+        "city": Update_Venue.city,
+        "state": Update_Venue.state,
+        "phone": Update_Venue.phone,
+        "website": Update_Venue.website,
+        "facebook_link": Update_Venue.facebook_link,
+        "seeking_telent": Update_Venue.seeking_talent,
+        "seeking_description": Update_Venue.seeking_description,
+        "image_link": Update_Venue.image_link
+    }
+    form = VenueForm(data=venue)
+    return render_template('forms/edit_venue.html', form=form, venue=venue)
+
+
+@venue_pages.route('/venues/<int:venue_id>/edit', methods=['POST'])
+def edit_venue_submission(venue_id):
+    """ The function update venue properties by its id to database   
+
+    Args: 
+       venue_id: venue id is primary key and use to query any Venue by its id 
+
+    Returns:
+       Render venue page for updated venue.     
+    """
+    try:
+        Venue_form = VenueForm(request.form)
+        Update_Venue= Venue.query.get(venue_id)
+        Update_Venue.name= Venue_form.name.data
+        Update_Venue.genres= Genre.get_or_create_all(Venue_form.genres.data)
+        Update_Venue.address= Venue_form.address.data
+        Update_Venue.city= Venue_form.city.data
+        Update_Venue.state= Venue_form.state.data
+        Update_Venue.phone= Venue_form.phone.data
+        Update_Venue.facebook_link= Venue_form.facebook_link.data
+        if(not ValidPhoneNumber(Venue_form.phone.data)):
+            raise ValueError
+        db.session.commit()
+        page_cache.invalidate('venue', venue_id)
+        jobs.enqueue('invalidate_related_pages', 'venue', venue_id)
+    except ValueError:
+        db.session.rollback()
+        flash('Incorrect phone number format xxx-xxx-xxxx   (' + request.form['phone']+ '),  please try again.')
+    except:
+        db.session.rollback()
+    finally:
+        db.session.close()
+        
+    return redirect(url_for('venues.show_venue', venue_id=venue_id))
+
+# endregion